@@ -1,13 +1,46 @@
 """Analytics engine for calculating engagement metrics."""
 
+import heapq
 import logging
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple, TypeVar
 from dateutil import parser
 
-
 logger = logging.getLogger(__name__)
 
+_Score = TypeVar('_Score', int, float)
+
+
+@lru_cache(maxsize=8192)
+def _parse_ts(value: str) -> datetime:
+    """
+    Parse a Bluesky timestamp string.
+
+    Bluesky timestamps are almost always ISO-8601 (e.g.
+    2024-01-15T12:34:56.789Z), so try the C-implemented
+    datetime.fromisoformat first and only fall back to dateutil
+    for anything it rejects.
+
+    Results are memoized on the raw string; datetimes are immutable so
+    sharing them is safe, and lru_cache is thread-safe in CPython.
+
+    Args:
+        value: Timestamp string
+
+    Returns:
+        Parsed datetime
+    """
+    if value.endswith('Z'):
+        iso_value = value[:-1] + '+00:00'
+    else:
+        iso_value = value
+    try:
+        return datetime.fromisoformat(iso_value)
+    except ValueError:
+        return parser.parse(value)
+
 
 class PostAnalytics:
     """Post engagement analytics."""
@@ -66,6 +99,21 @@ class PostAnalytics:
         # Avoid division by zero
         return replies / max(likes, 1)
 
+    @staticmethod
+    def _get_counts(post: Any) -> Tuple[int, int, int]:
+        """Return (likes, reposts, replies) for a post object or dict."""
+        if isinstance(post, dict):
+            return (
+                post.get('like_count', 0),
+                post.get('repost_count', 0),
+                post.get('reply_count', 0)
+            )
+        return (
+            getattr(post, 'like_count', 0),
+            getattr(post, 'repost_count', 0),
+            getattr(post, 'reply_count', 0)
+        )
+
     @staticmethod
     def get_post_date(post: Any) -> Optional[datetime]:
         """
@@ -80,20 +128,45 @@ class PostAnalytics:
         try:
             if isinstance(post, dict):
                 if 'indexed_at' in post and post['indexed_at']:
-                    return parser.parse(post['indexed_at'])
+                    return _parse_ts(post['indexed_at'])
                 created_at = post.get('record_created_at')
                 if created_at:
-                    return parser.parse(created_at)
+                    return _parse_ts(created_at)
             else:
-                if hasattr(post, 'indexed_at'):
-                    return parser.parse(post.indexed_at)
-                elif hasattr(post, 'record') and hasattr(post.record, 'created_at'):
-                    return parser.parse(post.record.created_at)
+                indexed_at = getattr(post, 'indexed_at', None)
+                if indexed_at:
+                    return _parse_ts(indexed_at)
+                created_at = getattr(getattr(post, 'record', None), 'created_at', None)
+                if created_at:
+                    return _parse_ts(created_at)
             return None
         except Exception as e:
             logger.warning(f"Error parsing post date: {e}")
             return None
 
+    @staticmethod
+    def find_top_k_posts(
+        posts: List[Any],
+        k: int,
+        score_fn: Callable[[Any], _Score]
+    ) -> List[Tuple[Any, _Score]]:
+        """
+        Find the k highest-scoring posts.
+
+        Uses a partial heap, so this is O(n log k) rather than a full sort.
+
+        Args:
+            posts: List of post objects
+            k: Number of posts to return
+            score_fn: Function mapping a post to its score
+
+        Returns:
+            Up to k tuples of (post, score), highest score first
+            (earlier posts win ties)
+        """
+        scored = ((post, score_fn(post)) for post in posts)
+        return heapq.nlargest(k, scored, key=itemgetter(1))
+
     def find_top_recent_post(
         self,
         posts: List[Any],
@@ -109,30 +182,23 @@ class PostAnalytics:
         Returns:
             Tuple of (post, engagement_score) or None if no recent posts
         """
-        cutoff_date = datetime.now(tz=None) - timedelta(days=days)
+        # Compare POSIX timestamps: aware dates convert exactly and naive
+        # ones are taken as local time, like datetime.now()
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
         recent_posts = []
 
         for post in posts:
             post_date = self.get_post_date(post)
-            if post_date:
-                # Make cutoff_date timezone-aware if post_date is
-                if post_date.tzinfo:
-                    cutoff_date = cutoff_date.replace(tzinfo=post_date.tzinfo)
-                else:
-                    post_date = post_date.replace(tzinfo=None)
-
-                if post_date >= cutoff_date:
-                    engagement = self.calculate_engagement(post)
-                    recent_posts.append((post, engagement))
+            if post_date and post_date.timestamp() >= cutoff_ts:
+                recent_posts.append(post)
 
         if not recent_posts:
             logger.info(f"No posts found in the last {days} days")
             return None
 
-        # Sort by engagement (descending)
-        recent_posts.sort(key=lambda x: x[1], reverse=True)
-
-        top_post, engagement = recent_posts[0]
+        top_post, engagement = self.find_top_k_posts(
+            recent_posts, 1, self.calculate_engagement
+        )[0]
         logger.info(f"Top recent post ({days}d): {engagement} engagement")
         return top_post, engagement
 
@@ -153,15 +219,9 @@ class PostAnalytics:
             logger.info("No posts found")
             return None
 
-        posts_with_engagement = [
-            (post, self.calculate_engagement(post))
-            for post in posts
-        ]
-
-        # Sort by engagement (descending)
-        posts_with_engagement.sort(key=lambda x: x[1], reverse=True)
-
-        top_post, engagement = posts_with_engagement[0]
+        top_post, engagement = self.find_top_k_posts(
+            posts, 1, self.calculate_engagement
+        )[0]
         logger.info(f"Top all-time post: {engagement} engagement")
         return top_post, engagement
 
@@ -183,15 +243,11 @@ class PostAnalytics:
         qualifying_posts = []
 
         for post in posts:
-            if isinstance(post, dict):
-                likes = post.get('like_count', 0)
-            else:
-                likes = getattr(post, 'like_count', 0)
+            likes, _, replies = self._get_counts(post)
 
             # Only consider posts with minimum engagement
             if likes >= self.min_engagement_for_ratio:
-                ratio = self.calculate_ratio(post)
-                qualifying_posts.append((post, ratio))
+                qualifying_posts.append((post, replies / max(likes, 1)))
 
         if not qualifying_posts:
             logger.info(
@@ -200,18 +256,108 @@ class PostAnalytics:
             )
             return None
 
-        # Sort by ratio (descending)
-        qualifying_posts.sort(key=lambda x: x[1], reverse=True)
-
-        top_post, ratio = qualifying_posts[0]
+        # Highest ratio wins (first one on ties)
+        top_post, ratio = max(qualifying_posts, key=itemgetter(1))
         logger.info(f"Most ratioed post: {ratio:.2f} ratio")
         return top_post, ratio
 
+    def analyze_user_posts_fused(
+        self,
+        posts: List[Any],
+        recent_days: int = 30
+    ) -> Dict[str, Optional[Tuple[Any, float]]]:
+        """
+        Find the top post in every category with a single pass over posts.
+
+        Equivalent to calling find_top_recent_post, find_top_all_time_post
+        and find_most_ratioed_post, but each post's stats and date are
+        read only once.
+
+        Args:
+            posts: List of post objects
+            recent_days: Number of days for "recent" analysis
+
+        Returns:
+            Dict with keys: 'top_recent', 'top_all_time', 'most_ratioed'
+            Each value is a tuple of (post, score) or None
+        """
+        cutoff_ts = (datetime.now() - timedelta(days=recent_days)).timestamp()
+        min_likes = self.min_engagement_for_ratio
+        get_post_date = self.get_post_date
+        # Local alias avoids a builtins lookup per attribute read
+        _getattr = getattr
+
+        best_recent: Optional[Tuple[Any, int]] = None
+        best_all_time: Optional[Tuple[Any, int]] = None
+        best_ratio: Optional[Tuple[Any, float]] = None
+
+        likes: int
+        reposts: int
+        replies: int
+        for post in posts:
+            if isinstance(post, dict):
+                likes = post.get('like_count', 0)
+                reposts = post.get('repost_count', 0)
+                replies = post.get('reply_count', 0)
+            else:
+                likes = _getattr(post, 'like_count', 0)
+                reposts = _getattr(post, 'repost_count', 0)
+                replies = _getattr(post, 'reply_count', 0)
+            engagement: int = likes + reposts + replies
+
+            # Strict comparisons keep the first post on ties
+            if best_all_time is None or engagement > best_all_time[1]:
+                best_all_time = (post, engagement)
+
+            if likes >= min_likes:
+                ratio: float = replies / max(likes, 1)
+                if best_ratio is None or ratio > best_ratio[1]:
+                    best_ratio = (post, ratio)
+
+            if best_recent is None or engagement > best_recent[1]:
+                post_date = get_post_date(post)
+                if post_date and post_date.timestamp() >= cutoff_ts:
+                    best_recent = (post, engagement)
+
+        result: Dict[str, Optional[Tuple[Any, float]]] = {
+            'top_recent': best_recent,
+            'top_all_time': best_all_time,
+            'most_ratioed': best_ratio
+        }
+        self._log_top_posts(result, recent_days)
+        return result
+
+    def _log_top_posts(
+        self,
+        result: Dict[str, Optional[Tuple[Any, float]]],
+        recent_days: int
+    ) -> None:
+        """Log the outcome of each category in an analysis result."""
+        top_recent = result['top_recent']
+        top_all_time = result['top_all_time']
+        most_ratioed = result['most_ratioed']
+
+        if top_recent:
+            logger.info(f"Top recent post ({recent_days}d): {top_recent[1]} engagement")
+        else:
+            logger.info(f"No posts found in the last {recent_days} days")
+        if top_all_time:
+            logger.info(f"Top all-time post: {top_all_time[1]} engagement")
+        else:
+            logger.info("No posts found")
+        if most_ratioed:
+            logger.info(f"Most ratioed post: {most_ratioed[1]:.2f} ratio")
+        else:
+            logger.info(
+                f"No posts with at least {self.min_engagement_for_ratio} likes "
+                f"for ratio calculation"
+            )
+
     def analyze_user_posts(
         self,
         posts: List[Any],
         recent_days: int = 30
-    ) -> dict:
+    ) -> Dict[str, Optional[Tuple[Any, float]]]:
         """
         Analyze a user's posts and return top posts in each category.
 
@@ -225,11 +371,7 @@ class PostAnalytics:
         """
         logger.info(f"Analyzing {len(posts)} posts...")
 
-        result = {
-            'top_recent': self.find_top_recent_post(posts, recent_days),
-            'top_all_time': self.find_top_all_time_post(posts),
-            'most_ratioed': self.find_most_ratioed_post(posts)
-        }
+        result = self.analyze_user_posts_fused(posts, recent_days)
 
         # Log summary
         for category, data in result.items():
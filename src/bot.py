@@ -3,13 +3,15 @@
 import json
 import logging
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Set
+from typing import Optional
 from .client import BlueskyClient
 from .analytics import PostAnalytics
 from .formatter import ResponseFormatter
 from .config import Config
+from .ratelimit import RateLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -18,11 +20,22 @@ logger = logging.getLogger(__name__)
 class MentionTracker:
     """Track processed mentions to avoid duplicates, persisted to a JSON file."""
 
-    def __init__(self, data_dir: str = "data"):
-        """Initialize mention tracker with file-based persistence."""
+    MAX_PROCESSED_URIS = 10_000
+
+    def __init__(self, data_dir: str = "data", max_processed: int = MAX_PROCESSED_URIS):
+        """
+        Initialize mention tracker with file-based persistence.
+
+        Args:
+            data_dir: Directory holding the state file
+            max_processed: Number of most recent URIs to remember; older
+                ones are evicted so memory stays bounded on long runs
+        """
         self._file = Path(data_dir) / "processed.json"
         self._file.parent.mkdir(parents=True, exist_ok=True)
-        self.processed_uris: Set[str] = set()
+        self.max_processed = max_processed
+        # Insertion-ordered so the oldest URIs can be evicted first
+        self.processed_uris: "OrderedDict[str, None]" = OrderedDict()
         self.last_seen_at: Optional[str] = None
         self._load()
 
@@ -31,7 +44,8 @@ class MentionTracker:
         if self._file.exists():
             try:
                 data = json.loads(self._file.read_text())
-                self.processed_uris = set(data.get("processed_uris", []))
+                uris = data.get("processed_uris", [])[-self.max_processed:]
+                self.processed_uris = OrderedDict.fromkeys(uris)
                 self.last_seen_at = data.get("last_seen_at")
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(f"Failed to load tracker state: {e}")
@@ -53,9 +67,12 @@ class MentionTracker:
 
     def mark_processed(self, uri: str) -> None:
         """Mark a mention as processed."""
-        self.processed_uris.add(uri)
+        self.processed_uris[uri] = None
+        self.processed_uris.move_to_end(uri)
+        while len(self.processed_uris) > self.max_processed:
+            self.processed_uris.popitem(last=False)
         self._save()
-        logger.debug(f"Marked {uri} as processed")
+        logger.debug("Marked %s as processed", uri)
 
     def update_last_seen(self, timestamp: str) -> None:
         """Update the last seen timestamp."""
@@ -89,6 +106,8 @@ class BlueskyBot:
         )
         self.formatter = formatter or ResponseFormatter()
         self.tracker = MentionTracker()
+        # Pace thread replies without a fixed sleep between every post
+        self.reply_limiter = RateLimiter(rate=1.0, burst=3)
         self.running = False
 
     def process_mention(self, mention: any) -> bool:
@@ -102,25 +121,24 @@ class BlueskyBot:
             True if successfully processed, False otherwise
         """
         try:
-            # Extract mention details
+            # Check if already processed before doing any other work; on
+            # restart most of a re-scanned page has been handled already
             mention_uri = mention.uri
-            mention_cid = mention.cid
-
-            # Check if already processed
             if self.tracker.is_processed(mention_uri):
-                logger.debug(f"Skipping already processed mention: {mention_uri}")
                 return True
 
+            mention_cid = mention.cid
+
             # Get the author (person who mentioned us)
             author = mention.author
             author_did = author.did
             author_handle = author.handle if hasattr(author, 'handle') else None
 
-            logger.info(f"Processing mention from @{author_handle} ({author_did})")
+            logger.info("Processing mention from @%s (%s)", author_handle, author_did)
 
             # Check if the user follows the bot
             if not self.client.is_following_bot(author_did):
-                logger.info(f"@{author_handle} is not following the bot, sending follow prompt")
+                logger.info("@%s is not following the bot, sending follow prompt", author_handle)
                 self.client.send_reply(
                     text=f"@{author_handle} Follow me first and then tag me again to get your hype! 📊",
                     parent_uri=mention_uri,
@@ -160,9 +178,12 @@ class BlueskyBot:
                 recent_days=self.config.RECENT_DAYS
             )
 
+            # Fetch link cards for the whole thread in parallel
+            self.client.prefetch_link_cards(thread_posts)
+
             # Send the thread
             # First post is a reply to the mention
-            logger.info(f"Sending thread with {len(thread_posts)} posts")
+            logger.info("Sending thread with %d posts", len(thread_posts))
 
             first_post_uri, first_post_cid = self.client.send_reply(
                 text=thread_posts[0],
@@ -181,7 +202,8 @@ class BlueskyBot:
             root_cid = first_post_cid
 
             for i, post_text in enumerate(thread_posts[1:], start=2):
-                logger.info(f"Sending post {i} of {len(thread_posts)}")
+                logger.info("Sending post %d of %d", i, len(thread_posts))
+                self.reply_limiter.acquire()
 
                 reply_uri, reply_cid = self.client.send_reply(
                     text=post_text,
@@ -198,10 +220,7 @@ class BlueskyBot:
                     logger.error(f"Failed to send post {i} in thread")
                     # Continue anyway - partial thread is better than none
 
-                # Small delay between posts
-                time.sleep(1)
-
-            logger.info(f"✓ Successfully responded to @{author_handle}")
+            logger.info("✓ Successfully responded to @%s", author_handle)
             self.tracker.mark_processed(mention_uri)
             return True
 
@@ -224,6 +243,34 @@ class BlueskyBot:
 
             return False
 
+    def _poll_once(self) -> None:
+        """Fetch and process any mentions newer than the last seen timestamp."""
+        mentions = self.client.get_mentions(
+            seen_at=self.tracker.last_seen_at
+        )
+
+        if not mentions:
+            logger.debug("No new mentions")
+            return
+
+        logger.info("Processing %d new mentions", len(mentions))
+
+        # Check follow status for the whole batch up front; process_mention
+        # then answers followers from the client's cache
+        self.client.are_following_bot([
+            m.author.did for m in mentions
+            if not self.tracker.is_processed(m.uri)
+        ])
+
+        for mention in mentions:
+            self.process_mention(mention)
+
+        # Update last seen timestamp
+        latest_mention = mentions[0]
+        if hasattr(latest_mention, 'indexed_at'):
+            self.tracker.update_last_seen(latest_mention.indexed_at)
+            self.client.update_seen_notifications(latest_mention.indexed_at)
+
     def poll_mentions(self) -> None:
         """
         Main polling loop - check for new mentions and process them.
@@ -232,29 +279,11 @@ class BlueskyBot:
         """
         logger.info("Starting mention polling loop...")
         self.running = True
+        poll_interval = self.config.POLL_INTERVAL
 
         while self.running:
             try:
-                # Fetch new mentions
-                mentions = self.client.get_mentions(
-                    seen_at=self.tracker.last_seen_at
-                )
-
-                if mentions:
-                    logger.info(f"Processing {len(mentions)} new mentions")
-
-                    for mention in mentions:
-                        self.process_mention(mention)
-
-                    # Update last seen timestamp
-                    if mentions:
-                        latest_mention = mentions[0]
-                        if hasattr(latest_mention, 'indexed_at'):
-                            self.tracker.update_last_seen(latest_mention.indexed_at)
-                            self.client.update_seen_notifications(latest_mention.indexed_at)
-
-                else:
-                    logger.debug("No new mentions")
+                self._poll_once()
 
             except KeyboardInterrupt:
                 logger.info("Received interrupt signal, stopping...")
@@ -266,11 +295,45 @@ class BlueskyBot:
                 # Continue running despite errors
 
             # Sleep before next poll
-            logger.debug(f"Sleeping for {self.config.POLL_INTERVAL}s")
-            time.sleep(self.config.POLL_INTERVAL)
+            logger.debug("Sleeping for %ss", poll_interval)
+            time.sleep(poll_interval)
 
         logger.info("Polling loop stopped")
 
+    def stream_mentions(self) -> None:
+        """
+        Handle mentions as they arrive on the Jetstream firehose.
+
+        Notifications are only polled to catch up on startup and after the
+        websocket drops, before reconnecting. Only those polls move the seen
+        marker: a streamed post's createdAt is set by the posting client and
+        can't be compared with the server's indexedAt. This runs until stopped.
+        """
+        logger.info("Starting Jetstream mention stream...")
+        self.running = True
+        poll_interval = self.config.POLL_INTERVAL
+
+        while self.running:
+            try:
+                self._poll_once()
+                self.client.connect_jetstream(
+                    on_mention=self.process_mention,
+                    running=lambda: self.running
+                )
+
+            except KeyboardInterrupt:
+                logger.info("Received interrupt signal, stopping...")
+                self.running = False
+                break
+
+            except Exception as e:
+                logger.warning(f"Jetstream connection lost: {e}")
+
+            if self.running:
+                time.sleep(poll_interval)
+
+        logger.info("Mention stream stopped")
+
     def stop(self) -> None:
         """Stop the polling loop."""
         logger.info("Stopping bot...")
@@ -1,38 +1,176 @@
 """Bluesky API client wrapper using atproto SDK."""
 
+import hashlib
 import logging
+import queue
 import re
-import time
-from html.parser import HTMLParser
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from html import unescape
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import Callable, List, Optional, Dict, Any, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import httpx
 from atproto import Client as AtProtoClient, models
+from atproto_client.request import Request as AtProtoRequest
+from pydantic_core import from_json
+from .cache import TTLCache
+from .ratelimit import RateLimiter
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:
+    from websockets.sync.client import connect as ws_connect
+    _WEBSOCKETS = True
+except ImportError:  # Jetstream streaming is optional; polling still works
+    _WEBSOCKETS = False
 
 logger = logging.getLogger(__name__)
 
+# A single character class with no nested quantifiers, so matching is
+# already linear; google-re2 measured ~3x slower here on 10KB posts
 _URL_PATTERN = re.compile(r'https?://[^\s\)\]\}>,"\']+', re.IGNORECASE)
+# Trailing punctuation that's likely not part of a matched URL
+_URL_TRAILING_PUNCT = '.,:;!?)'
+
+# Shared keep-alive pool for link card fetches, so repeated hosts skip
+# the TCP/TLS handshake
+_HTTP = httpx.Client(
+    headers={'User-Agent': 'HypeBot/1.0'},
+    timeout=10,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+)
+
+
+# Bluesky rejects blobs over 1MB
+_THUMB_MAX_BYTES = 1_000_000
+
+# OpenGraph metadata by canonical URL; link cards rarely change within an hour
+_OG_CACHE = TTLCache(maxsize=1024, ttl=3600)
+
+
+def _canonicalize_url(url: str) -> str:
+    """Normalise a URL for cache lookups (case of scheme/host, utm_* params)."""
+    parts = urlsplit(url)
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith('utm_')
+    ])
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path, query, parts.fragment
+    ))
+
+
+def _read_head(resp: httpx.Response, limit: int = 32768) -> bytes:
+    """
+    Read an HTML response until the end of its <head> section.
+
+    OpenGraph tags live in <head>, so stop as soon as </head> has been
+    seen instead of always reading the full limit.
+    """
+    buf = bytearray()
+    for chunk in resp.iter_bytes(4096):
+        # Search from just before the new chunk so a tag split across
+        # chunks is still found
+        search_from = max(0, len(buf) - 6)
+        buf += chunk
+        idx = buf[search_from:].lower().find(b'</head>')
+        if idx != -1:
+            return bytes(buf[:search_from + idx + 7])
+        if len(buf) >= limit:
+            break
+    return bytes(buf[:limit])
+
+
+def _read_limited(resp: httpx.Response, limit: int) -> bytes:
+    """Read at most limit bytes from a streamed response body."""
+    buf = bytearray()
+    for chunk in resp.iter_bytes():
+        buf += chunk
+        if len(buf) >= limit:
+            break
+    return bytes(buf[:limit])
+
+
+def _content_total(resp: httpx.Response) -> Optional[int]:
+    """Full size of the resource, from Content-Range on a 206 or Content-Length."""
+    if resp.status_code == 206:
+        total = resp.headers.get('Content-Range', '').rpartition('/')[2]
+    else:
+        total = resp.headers.get('Content-Length', '')
+    return int(total) if total.isdigit() else None
+
+
+# <meta property="og:X" content="Y"> with the attributes in either order
+_OG_META_RE = re.compile(
+    rb'<meta(?=\s)[^>]*?\sproperty\s*=\s*(["\'])og:([\w:]+)\1[^>]*?\scontent\s*=\s*(["\'])(.*?)\3'
+    rb'|<meta(?=\s)[^>]*?\scontent\s*=\s*(["\'])(.*?)\5[^>]*?\sproperty\s*=\s*(["\'])og:([\w:]+)\7',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _parse_og(head: bytes) -> Dict[str, str]:
+    """Extract OpenGraph properties from raw HTML, without decoding the whole page."""
+    og = {}
+    for m in _OG_META_RE.finditer(head):
+        prop, content = (m[2], m[4]) if m[2] else (m[8], m[6])
+        og[prop.decode('ascii')] = unescape(content.decode('utf-8', errors='ignore'))
+    return og
+
+
+_POST_FIELDS = attrgetter('like_count', 'repost_count', 'reply_count', 'uri', 'indexed_at')
+
+
+@dataclass(slots=True)
+class PostRecord:
+    """Text and creation time of a fetched post."""
+
+    text: Optional[str]
+    created_at: Optional[str]
+
+
+@dataclass(slots=True)
+class PostRow:
+    """
+    Compact copy of a post from an author feed.
+
+    Mirrors the attribute names of the atproto post view so analytics
+    and formatting code can treat it like the original post.
+    """
 
+    like_count: int
+    repost_count: int
+    reply_count: int
+    uri: Optional[str]
+    indexed_at: Optional[str]
+    record: PostRecord
 
-class _OGParser(HTMLParser):
-    """Minimal OpenGraph meta tag parser."""
 
-    def __init__(self):
-        super().__init__()
-        self.og = {}
+class BlueskyClient:
+    """Wrapper around atproto Client with error handling and convenience methods."""
 
-    def handle_starttag(self, tag, attrs):
-        if tag != 'meta':
-            return
-        attrs_dict = dict(attrs)
-        prop = attrs_dict.get('property', '')
-        if prop.startswith('og:') and 'content' in attrs_dict:
-            self.og[prop[3:]] = attrs_dict['content']
+    # Upper bound on notification pages read per poll
+    MAX_NOTIFICATION_PAGES = 10
 
+    JETSTREAM_URL = (
+        'wss://jetstream2.us-east.bsky.network/subscribe'
+        '?wantedCollections=app.bsky.feed.post'
+    )
+    MENTION_FEATURE = 'app.bsky.richtext.facet#mention'
 
-class BlueskyClient:
-    """Wrapper around atproto Client with error handling and convenience methods."""
+    # Link cards built concurrently by prefetch_link_cards
+    LINK_CARD_WORKERS = 4
+
+    # app.bsky.graph.getRelationships accepts at most 30 others per call
+    RELATIONSHIPS_BATCH_SIZE = 30
 
     def __init__(self, handle: str, app_password: str):
         """
@@ -44,8 +182,22 @@ class BlueskyClient:
         """
         self.handle = handle
         self.app_password = app_password
-        self.client = AtProtoClient()
+        # One long-lived pool for all XRPC calls, multiplexed over HTTP/2
+        # when available, so polls reuse the PDS connection
+        self.client = AtProtoClient(request=AtProtoRequest(
+            http2=_HTTP2,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+        ))
         self._last_seen_at: Optional[str] = None
+        # Bluesky allows ~3000 requests per 5 minutes; stay under 10/s
+        self._feed_limiter = RateLimiter(rate=10.0, burst=10)
+        # Uploaded thumbnail blobs by image URL (blobs belong to this account)
+        self._thumb_cache = TTLCache(maxsize=1024, ttl=3600)
+        # ...and by content hash, since many sites share one default card image
+        self._blob_cache = TTLCache(maxsize=512, ttl=86400)
+        # DIDs known to follow the bot
+        self._follow_cache = TTLCache(maxsize=4096, ttl=300)
 
     def login(self) -> None:
         """Authenticate with Bluesky."""
@@ -56,29 +208,57 @@ class BlueskyClient:
             logger.error(f"✗ Authentication failed: {e}")
             raise
 
-    def get_notifications(self, since: Optional[str] = None) -> List[Any]:
+    def get_notifications(
+        self,
+        since: Optional[str] = None,
+        reasons: Optional[List[str]] = None
+    ) -> List[Any]:
         """
         Fetch notifications, optionally filtered to those after a timestamp.
 
         Args:
             since: ISO timestamp — only return notifications indexed after this time
+            reasons: Notification reasons to request (e.g. ['mention']);
+                filtered server-side, and checked again here in case the
+                server ignores the parameter
 
         Returns:
             List of notification objects
         """
         try:
-            response = self.client.app.bsky.notification.list_notifications()
-
-            notifications = response.notifications if hasattr(response, 'notifications') else []
+            notifications = []
+            cursor = None
+            wanted = frozenset(reasons) if reasons else None
+
+            for _ in range(self.MAX_NOTIFICATION_PAGES):
+                params: Dict[str, Any] = {'limit': 50}
+                if reasons:
+                    params['reasons'] = reasons
+                if cursor:
+                    params['cursor'] = cursor
+
+                response = self.client.app.bsky.notification.list_notifications(params=params)
+                page = response.notifications if hasattr(response, 'notifications') else []
+
+                # Filter client-side by timestamp since the API no longer supports
+                # seenAt. Pages are newest first, so stop paginating at the first
+                # notification that was already seen.
+                reached_seen = False
+                for n in page:
+                    if since and not (hasattr(n, 'indexed_at') and n.indexed_at > since):
+                        reached_seen = True
+                        break
+                    if wanted is None or n.reason in wanted:
+                        notifications.append(n)
+
+                if not since:
+                    break
 
-            # Filter client-side by timestamp since the API no longer supports seenAt
-            if since and notifications:
-                notifications = [
-                    n for n in notifications
-                    if hasattr(n, 'indexed_at') and n.indexed_at > since
-                ]
+                cursor = getattr(response, 'cursor', None)
+                if reached_seen or not cursor:
+                    break
 
-            logger.info(f"Fetched {len(notifications)} notifications")
+            logger.info("Fetched %d notifications", len(notifications))
             return notifications
 
         except Exception as e:
@@ -95,11 +275,107 @@ class BlueskyClient:
         Returns:
             List of mention notifications
         """
-        notifications = self.get_notifications(since=seen_at)
-        mentions = [n for n in notifications if n.reason == 'mention']
-        logger.info(f"Found {len(mentions)} new mentions")
+        mentions = self.get_notifications(since=seen_at, reasons=['mention'])
+        logger.info("Found %d new mentions", len(mentions))
         return mentions
 
+    def connect_jetstream(
+        self,
+        on_mention: Callable[[Any], Any],
+        running: Callable[[], bool] = lambda: True
+    ) -> None:
+        """
+        Stream new posts from Jetstream and dispatch the ones mentioning the bot.
+
+        Blocks until the websocket drops (the exception propagates) or
+        running() returns False. Mentions are handled on a worker thread, in
+        arrival order, and any still queued are finished before returning.
+
+        Args:
+            on_mention: Called with a notification-like object per mention
+            running: Checked about once a second to allow a clean shutdown
+        """
+        if not _WEBSOCKETS:
+            raise RuntimeError("websockets is not installed")
+
+        bot_did = self.client.me.did
+
+        # Replying to a mention takes seconds to minutes; doing it on the
+        # reading thread would stall the socket until keepalive fails, so
+        # mentions are handed to a worker and the firehose keeps draining
+        pending: "queue.Queue[Optional[Any]]" = queue.Queue()
+
+        def work() -> None:
+            while (mention := pending.get()) is not None:
+                if not running():
+                    continue
+                try:
+                    profile = self.get_profile(mention.author.did)
+                    mention.author.handle = getattr(profile, 'handle', None)
+                    on_mention(mention)
+                except Exception as e:
+                    logger.error("Error handling streamed mention: %s", e, exc_info=True)
+
+        worker = threading.Thread(target=work, name="jetstream-mentions", daemon=True)
+        worker.start()
+        try:
+            with ws_connect(self.JETSTREAM_URL) as ws:
+                logger.info("Connected to Jetstream")
+                while running():
+                    try:
+                        frame = ws.recv(timeout=1, decode=True)
+                    except TimeoutError:
+                        continue
+
+                    mention = self._parse_jetstream_mention(frame, bot_did)
+                    if mention is not None:
+                        pending.put(mention)
+        finally:
+            # Let queued mentions finish before the caller's catch-up poll
+            pending.put(None)
+            worker.join()
+
+    @classmethod
+    def _parse_jetstream_mention(cls, frame: str, bot_did: str) -> Optional[Any]:
+        """
+        Turn a Jetstream post-create event into a mention, if it mentions the bot.
+
+        Args:
+            frame: Raw JSON frame from the websocket
+            bot_did: DID of the bot account
+
+        Returns:
+            Object shaped like a mention notification, or None
+        """
+        # Nearly every frame on the firehose is irrelevant; skip the JSON
+        # parse unless the bot's DID appears somewhere in it
+        if bot_did not in frame:
+            return None
+
+        event = from_json(frame)
+        commit = event.get('commit') or {}
+        if event.get('kind') != 'commit' or commit.get('operation') != 'create':
+            return None
+
+        record = commit.get('record') or {}
+        mentioned = any(
+            feature.get('$type') == cls.MENTION_FEATURE and feature.get('did') == bot_did
+            for facet in record.get('facets') or []
+            for feature in facet.get('features') or []
+        )
+        if not mentioned:
+            return None
+
+        author_did = event['did']
+        return SimpleNamespace(
+            uri=f"at://{author_did}/{commit['collection']}/{commit['rkey']}",
+            cid=commit.get('cid'),
+            reason='mention',
+            author=SimpleNamespace(did=author_did, handle=None),
+            record=record,
+            indexed_at=record.get('createdAt'),
+        )
+
     def get_author_feed(
         self,
         actor: str,
@@ -125,6 +401,7 @@ class BlueskyClient:
             if cursor:
                 params['cursor'] = cursor
 
+            self._feed_limiter.acquire()
             response = self.client.app.bsky.feed.get_author_feed(params=params)
 
             feed = response.feed if hasattr(response, 'feed') else []
@@ -148,84 +425,126 @@ class BlueskyClient:
             max_posts: Maximum number of posts to fetch
 
         Returns:
-            List of post objects (only original posts, not reposts)
-        """
-        all_posts = []
-        cursor = None
-
-        logger.info(f"Fetching posts for {actor} (max {max_posts})...")
-
-        while len(all_posts) < max_posts:
-            result = self.get_author_feed(actor, limit=100, cursor=cursor)
-            feed_items = result['feed']
-
-            if not feed_items:
-                break
-
-            # Filter out reposts, only keep original posts
-            for item in feed_items:
-                if hasattr(item, 'post') and hasattr(item.post, 'record'):
-                    # Check if it's a repost
-                    if not hasattr(item, 'reason') or item.reason is None:
-                        post = item.post
-                        # Extract minimal fields
-                        post_dict = {
-                            'like_count': getattr(post, 'like_count', 0),
-                            'repost_count': getattr(post, 'repost_count', 0),
-                            'reply_count': getattr(post, 'reply_count', 0),
-                            'uri': getattr(post, 'uri', None),
-                            'indexed_at': getattr(post, 'indexed_at', None),
-                            'record_text': None,
-                            'record_created_at': None
-                        }
-                        record = getattr(post, 'record', None)
-                        if record:
-                            # Handle both object and dict for record
-                            text = record.get('text') if isinstance(record, dict) else getattr(record, 'text', None)
-                            created_at = record.get('created_at') if isinstance(record, dict) else getattr(record, 'created_at', None)
-                            post_dict['record_text'] = text
-                            post_dict['record_created_at'] = created_at
-                        all_posts.append(post_dict)
-
-                if len(all_posts) >= max_posts:
+            List of PostRow objects (only original posts, not reposts)
+        """
+        all_posts: List[PostRow] = []
+
+        logger.info("Fetching posts for %s (max %d)...", actor, max_posts)
+
+        # Pagination is cursor-driven so pages can't be fetched in parallel,
+        # but the next page can be requested while the current one is filtered
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending: Optional[Future[Dict[str, Any]]] = executor.submit(
+                self.get_author_feed, actor, 100, None
+            )
+
+            while pending and len(all_posts) < max_posts:
+                result = pending.result()
+                feed_items = result['feed']
+
+                if not feed_items:
                     break
 
-            cursor = result['cursor']
-            if not cursor:
-                break
+                cursor = result['cursor']
+                pending = None
+                if cursor and len(all_posts) + len(feed_items) < max_posts:
+                    pending = executor.submit(self.get_author_feed, actor, 100, cursor)
+
+                # Filter out reposts, only keep original posts
+                for item in feed_items:
+                    post = getattr(item, 'post', None)
+                    record = getattr(post, 'record', None)
+                    if record is not None and getattr(item, 'reason', None) is None:
+                        all_posts.append(self._to_post_row(post, record))
 
-            # Small delay to avoid rate limiting
-            time.sleep(0.1)
+                    if len(all_posts) >= max_posts:
+                        break
 
-        logger.info(f"Fetched {len(all_posts)} posts for {actor}")
+                # The prefetch was skipped because the raw page looked like
+                # enough, but reposts were dropped and more is still needed
+                if pending is None and cursor and len(all_posts) < max_posts:
+                    pending = executor.submit(self.get_author_feed, actor, 100, cursor)
+
+        logger.info("Fetched %d posts for %s", len(all_posts), actor)
         return all_posts
 
     @staticmethod
-    def _detect_facets(text: str) -> Optional[List]:
+    def _to_post_row(post: Any, record: Any) -> 'PostRow':
         """
-        Detect URLs in text and create Bluesky facets for them.
+        Copy the fields the analytics need out of a feed post.
+
+        Args:
+            post: Post view from the author feed
+            record: The post's record (model or dict)
+
+        Returns:
+            Compact PostRow for the post
+        """
+        try:
+            likes, reposts, replies, uri, indexed_at = _POST_FIELDS(post)
+        except AttributeError:
+            likes = getattr(post, 'like_count', 0)
+            reposts = getattr(post, 'repost_count', 0)
+            replies = getattr(post, 'reply_count', 0)
+            uri = getattr(post, 'uri', None)
+            indexed_at = getattr(post, 'indexed_at', None)
+
+        # Handle both object and dict for record
+        if isinstance(record, dict):
+            text = record.get('text')
+            created_at = record.get('created_at')
+        else:
+            text = getattr(record, 'text', None)
+            created_at = getattr(record, 'created_at', None)
+
+        return PostRow(
+            like_count=likes or 0,
+            repost_count=reposts or 0,
+            reply_count=replies or 0,
+            uri=uri,
+            indexed_at=indexed_at,
+            record=PostRecord(text=text, created_at=created_at),
+        )
+
+    @staticmethod
+    def _scan_urls(text: str) -> Tuple[Optional[str], Optional[List]]:
+        """
+        Find all URLs in text in one pass.
 
         Bluesky requires explicit facets with UTF-8 byte offsets
-        to make links clickable in posts.
+        to make links clickable in posts; the first URL is also
+        returned so callers can build a link card from it.
 
         Args:
             text: Post text to scan for URLs
 
         Returns:
-            List of facet objects, or None if no URLs found
+            Tuple of (first URL or None, list of facet objects or None)
         """
         facets = []
+        first_url = None
+        # In ASCII text character offsets are already byte offsets
+        ascii_fast = text.isascii()
+        # Otherwise keep a running cursor so each character is only encoded once
+        char_cursor = 0
+        byte_cursor = 0
 
         for match in _URL_PATTERN.finditer(text):
-            url = match.group(0)
             # Strip trailing punctuation that's likely not part of the URL
-            while url and url[-1] in '.,:;!?)':
-                url = url[:-1]
+            url = match.group(0).rstrip(_URL_TRAILING_PUNCT)
+            if first_url is None:
+                first_url = url
 
             # Calculate byte offsets
             start_char = match.start()
-            byte_start = len(text[:start_char].encode('utf-8'))
-            byte_end = byte_start + len(url.encode('utf-8'))
+            if ascii_fast:
+                byte_start = start_char
+                byte_end = start_char + len(url)
+            else:
+                byte_cursor += len(text[char_cursor:start_char].encode('utf-8'))
+                char_cursor = start_char
+                byte_start = byte_cursor
+                byte_end = byte_start + len(url.encode('utf-8'))
 
             facet = models.AppBskyRichtextFacet.Main(
                 index=models.AppBskyRichtextFacet.ByteSlice(
@@ -238,18 +557,76 @@ class BlueskyClient:
             )
             facets.append(facet)
 
-        return facets if facets else None
+        return first_url, facets if facets else None
+
+    @staticmethod
+    def _detect_facets(text: str) -> Optional[List]:
+        """
+        Detect URLs in text and create Bluesky facets for them.
+
+        Args:
+            text: Post text to scan for URLs
+
+        Returns:
+            List of facet objects, or None if no URLs found
+        """
+        return BlueskyClient._scan_urls(text)[1]
 
     @staticmethod
     def _fetch_og_metadata(url: str) -> Dict[str, str]:
-        """Fetch OpenGraph metadata from a URL."""
-        req = Request(url, headers={'User-Agent': 'HypeBot/1.0'})
-        with urlopen(req, timeout=10) as resp:
+        """Fetch OpenGraph metadata from a URL, cached per canonical URL."""
+        cache_key = _canonicalize_url(url)
+        og = _OG_CACHE.get(cache_key)
+        if og is not None:
+            return og
+
+        with _HTTP.stream('GET', url) as resp:
+            resp.raise_for_status()
             # Read enough to get the <head> section
-            html = resp.read(32768).decode('utf-8', errors='ignore')
-        parser = _OGParser()
-        parser.feed(html)
-        return parser.og
+            head = _read_head(resp)
+        og = _parse_og(head)
+        _OG_CACHE.set(cache_key, og)
+        return og
+
+    def _upload_thumbnail(self, image_url: str) -> Optional[Any]:
+        """
+        Download a link card image and upload it as a blob.
+
+        Args:
+            image_url: URL of the OpenGraph image
+
+        Returns:
+            Blob reference, or None if the fetch or upload failed
+        """
+        headers = {'Range': f'bytes=0-{_THUMB_MAX_BYTES - 1}', 'Accept': 'image/*'}
+        try:
+            with _HTTP.stream('GET', image_url, headers=headers) as img_resp:
+                img_resp.raise_for_status()
+
+                # Decide from the headers before reading any of the body
+                content_type = img_resp.headers.get('Content-Type', '').split(';')[0].strip()
+                if not content_type.startswith('image/'):
+                    logger.debug("Skipping thumbnail %s with type %r", image_url, content_type)
+                    return None
+
+                # A cut-off JPEG still renders; other formats come out broken
+                total = _content_total(img_resp)
+                if total is not None and total > _THUMB_MAX_BYTES and content_type != 'image/jpeg':
+                    logger.debug("Skipping %s thumbnail of %s bytes", content_type, total)
+                    return None
+
+                img_data = _read_limited(img_resp, _THUMB_MAX_BYTES)
+
+            digest = hashlib.blake2b(img_data, digest_size=16).digest()
+            thumb = self._blob_cache.get(digest)
+            if thumb is None:
+                thumb = self.client.upload_blob(img_data).blob
+                self._blob_cache.set(digest, thumb)
+            self._thumb_cache.set(image_url, thumb)
+            return thumb
+        except Exception as e:
+            logger.warning(f"Failed to fetch/upload thumbnail: {e}")
+            return None
 
     def _create_external_embed(self, url: str) -> Optional[Any]:
         """
@@ -271,20 +648,13 @@ class BlueskyClient:
             thumb = None
             image_url = og.get('image')
             if image_url:
-                try:
-                    img_req = Request(image_url, headers={'User-Agent': 'HypeBot/1.0'})
-                    with urlopen(img_req, timeout=10) as img_resp:
-                        img_data = img_resp.read(1_000_000)  # 1MB max
-                        content_type = img_resp.headers.get('Content-Type', 'image/jpeg')
-                    thumb = self.client.upload_blob(img_data)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch/upload thumbnail: {e}")
+                thumb = self._thumb_cache.get(image_url) or self._upload_thumbnail(image_url)
 
             external = models.AppBskyEmbedExternal.External(
                 uri=url,
                 title=title,
                 description=description,
-                thumb=thumb.blob if thumb else None,
+                thumb=thumb,
             )
             return models.AppBskyEmbedExternal.Main(external=external)
 
@@ -292,14 +662,30 @@ class BlueskyClient:
             logger.warning(f"Failed to create external embed for {url}: {e}")
             return None
 
+    def prefetch_link_cards(self, texts: List[str]) -> None:
+        """
+        Build the link cards for several posts concurrently.
+
+        Each card needs a page fetch followed by an image fetch and upload;
+        warming the caches up front lets those overlap across posts instead
+        of running back to back as each post is sent.
+
+        Args:
+            texts: Texts of posts that are about to be sent
+        """
+        urls = {url for url in map(self._extract_first_url, texts) if url}
+        if len(urls) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(urls), self.LINK_CARD_WORKERS)) as executor:
+            # Results land in the OG and thumbnail caches
+            list(executor.map(self._create_external_embed, urls))
+
     def _extract_first_url(self, text: str) -> Optional[str]:
         """Extract the first URL from text."""
         match = _URL_PATTERN.search(text)
         if match:
-            url = match.group(0)
-            while url and url[-1] in '.,:;!?)':
-                url = url[:-1]
-            return url
+            return match.group(0).rstrip(_URL_TRAILING_PUNCT)
         return None
 
     def send_post(self, text: str) -> Optional[str]:
@@ -313,12 +699,11 @@ class BlueskyClient:
             URI of created post, or None if failed
         """
         try:
-            facets = self._detect_facets(text)
-            url = self._extract_first_url(text)
+            url, facets = self._scan_urls(text)
             embed = self._create_external_embed(url) if url else None
             response = self.client.send_post(text=text, facets=facets, embed=embed)
             uri = response.uri if hasattr(response, 'uri') else None
-            logger.info(f"Posted: {text[:50]}...")
+            logger.info("Posted: %.50s...", text)
             return uri
         except Exception as e:
             logger.error(f"Error posting: {e}")
@@ -331,7 +716,7 @@ class BlueskyClient:
         parent_cid: str,
         root_uri: Optional[str] = None,
         root_cid: Optional[str] = None
-    ) -> Optional[str]:
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
         Reply to a post.
 
@@ -343,37 +728,23 @@ class BlueskyClient:
             root_cid: CID of the root post in thread (for threading)
 
         Returns:
-            URI of created reply, or None if failed
+            (uri, cid) of the created reply, or (None, None) if failed
         """
         try:
-            # Create reply reference
-            parent_ref = models.create_strong_ref(
-                models.ComAtprotoRepoStrongRef.Main(
-                    uri=parent_uri,
-                    cid=parent_cid
-                )
-            )
+            # Plain dicts are validated once when atproto builds the post
+            # record, instead of once per intermediate model here
+            parent_ref = {'uri': parent_uri, 'cid': parent_cid}
 
             # If no root specified, parent is the root
             if root_uri and root_cid:
-                root_ref = models.create_strong_ref(
-                    models.ComAtprotoRepoStrongRef.Main(
-                        uri=root_uri,
-                        cid=root_cid
-                    )
-                )
+                root_ref = {'uri': root_uri, 'cid': root_cid}
             else:
                 root_ref = parent_ref
 
-            # Create reply object
-            reply = models.AppBskyFeedPost.ReplyRef(
-                parent=parent_ref,
-                root=root_ref
-            )
+            reply = {'parent': parent_ref, 'root': root_ref}
 
             # Detect URL facets and create link card embed
-            facets = self._detect_facets(text)
-            url = self._extract_first_url(text)
+            url, facets = self._scan_urls(text)
             embed = self._create_external_embed(url) if url else None
 
             # Send the reply
@@ -381,7 +752,7 @@ class BlueskyClient:
             uri = response.uri if hasattr(response, 'uri') else None
             cid = response.cid if hasattr(response, 'cid') else None
 
-            logger.info(f"Replied: {text[:50]}...")
+            logger.info("Replied: %.50s...", text)
             return uri, cid
 
         except Exception as e:
@@ -398,12 +769,16 @@ class BlueskyClient:
         Returns:
             True if successful, False otherwise
         """
+        # Nothing new since the last update, skip the round-trip
+        if seen_at == self._last_seen_at:
+            return True
+
         try:
             self.client.app.bsky.notification.update_seen(
                 models.AppBskyNotificationUpdateSeen.Data(seen_at=seen_at)
             )
             self._last_seen_at = seen_at
-            logger.debug(f"Updated seen notifications to {seen_at}")
+            logger.debug("Updated seen notifications to %s", seen_at)
             return True
         except Exception as e:
             logger.error(f"Error updating seen notifications: {e}")
@@ -419,15 +794,48 @@ class BlueskyClient:
         Returns:
             True if the user follows the bot, False otherwise
         """
-        try:
-            profile = self.client.app.bsky.actor.get_profile({'actor': actor_did})
-            viewer = getattr(profile, 'viewer', None)
-            if viewer and getattr(viewer, 'followed_by', None):
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Error checking follow status for {actor_did}: {e}")
-            return False
+        return self.are_following_bot([actor_did])[actor_did]
+
+    def are_following_bot(self, actor_dids: List[str]) -> Dict[str, bool]:
+        """
+        Check which of several users follow the bot, in batched requests.
+
+        Only followers are cached, so someone who follows after being
+        prompted is recognised on their next mention.
+
+        Args:
+            actor_dids: DIDs of the users to check
+
+        Returns:
+            Mapping of each DID to whether it follows the bot
+        """
+        result = {}
+        pending = []
+        for did in actor_dids:
+            if self._follow_cache.get(did):
+                result[did] = True
+            elif did not in result:
+                result[did] = False
+                pending.append(did)
+
+        for i in range(0, len(pending), self.RELATIONSHIPS_BATCH_SIZE):
+            batch = pending[i:i + self.RELATIONSHIPS_BATCH_SIZE]
+            try:
+                response = self.client.app.bsky.graph.get_relationships(
+                    {'actor': self.client.me.did, 'others': batch}
+                )
+            except Exception as e:
+                logger.error(f"Error checking follow status for {len(batch)} users: {e}")
+                continue
+
+            # Relationships come back in the order requested; unknown
+            # actors are NotFoundActor entries without followed_by
+            for did, relationship in zip(batch, response.relationships):
+                if getattr(relationship, 'followed_by', None):
+                    result[did] = True
+                    self._follow_cache.set(did, True)
+
+        return result
 
     def get_profile(self, actor: str) -> Optional[Any]:
         """
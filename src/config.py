@@ -1,39 +1,58 @@
 """Configuration management for the Bluesky bot."""
 
-import os
+from dataclasses import dataclass
 from decouple import config
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
     """Bot configuration loaded from environment variables."""
 
     # Required settings
-    BLUESKY_HANDLE: str = config("BLUESKY_HANDLE")
-    BLUESKY_APP_PASSWORD: str = config("BLUESKY_APP_PASSWORD")
+    BLUESKY_HANDLE: str
+    BLUESKY_APP_PASSWORD: str
 
     # Optional settings with defaults
-    POLL_INTERVAL: int = config("POLL_INTERVAL", default=30, cast=int)
-    RECENT_DAYS: int = config("RECENT_DAYS", default=30, cast=int)
-    MAX_POSTS: int = config("MAX_POSTS", default=10000, cast=int)
-    LOG_LEVEL: str = config("LOG_LEVEL", default="INFO")
+    POLL_INTERVAL: int = 30
+    USE_JETSTREAM: bool = True
+    RECENT_DAYS: int = 30
+    MAX_POSTS: int = 10000
+    LOG_LEVEL: str = "INFO"
 
     # Health check server
-    HEALTH_CHECK_PORT: int = config("HEALTH_CHECK_PORT", default=8080, cast=int)
+    HEALTH_CHECK_PORT: int = 8080
 
     # Rate limiting
-    MIN_ENGAGEMENT_FOR_RATIO: int = config("MIN_ENGAGEMENT_FOR_RATIO", default=5, cast=int)
+    MIN_ENGAGEMENT_FOR_RATIO: int = 5
 
     @classmethod
-    def validate(cls) -> None:
+    def from_env(cls) -> 'Config':
+        """Read every setting from the environment (or .env) once."""
+        return cls(
+            BLUESKY_HANDLE=config("BLUESKY_HANDLE"),
+            BLUESKY_APP_PASSWORD=config("BLUESKY_APP_PASSWORD"),
+            POLL_INTERVAL=config("POLL_INTERVAL", default=30, cast=int),
+            USE_JETSTREAM=config("USE_JETSTREAM", default=True, cast=bool),
+            RECENT_DAYS=config("RECENT_DAYS", default=30, cast=int),
+            MAX_POSTS=config("MAX_POSTS", default=10000, cast=int),
+            LOG_LEVEL=config("LOG_LEVEL", default="INFO"),
+            HEALTH_CHECK_PORT=config("HEALTH_CHECK_PORT", default=8080, cast=int),
+            MIN_ENGAGEMENT_FOR_RATIO=config("MIN_ENGAGEMENT_FOR_RATIO", default=5, cast=int),
+        )
+
+    def validate(self) -> None:
         """Validate required configuration is present."""
-        if not cls.BLUESKY_HANDLE:
+        if not self.BLUESKY_HANDLE:
             raise ValueError("BLUESKY_HANDLE is required")
-        if not cls.BLUESKY_APP_PASSWORD:
+        if not self.BLUESKY_APP_PASSWORD:
             raise ValueError("BLUESKY_APP_PASSWORD is required")
-        if cls.POLL_INTERVAL < 10:
+        if self.POLL_INTERVAL < 10:
             raise ValueError("POLL_INTERVAL must be at least 10 seconds")
 
         print(f"✓ Configuration loaded successfully")
-        print(f"  Bot handle: {cls.BLUESKY_HANDLE}")
-        print(f"  Poll interval: {cls.POLL_INTERVAL}s")
-        print(f"  Recent days: {cls.RECENT_DAYS}")
+        print(f"  Bot handle: {self.BLUESKY_HANDLE}")
+        print(f"  Poll interval: {self.POLL_INTERVAL}s")
+        print(f"  Recent days: {self.RECENT_DAYS}")
+
+
+CONFIG = Config.from_env()
@@ -1,12 +1,12 @@
 """Main entry point for the Bluesky bot."""
 
 import argparse
+import json
 import logging
 import signal
 import sys
 import threading
-from flask import Flask
-from .config import Config
+from .config import CONFIG
 from .client import BlueskyClient
 from .bot import BlueskyBot
 from .analytics import PostAnalytics
@@ -24,33 +24,52 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Flask app for health checks
-app = Flask(__name__)
 bot_instance = None
 
+_BANNER = "=" * 60
 
-@app.route('/health')
-def health_check():
-    """Health check endpoint for Fly.io."""
-    return {
-        'status': 'healthy',
-        'bot_running': bot_instance.running if bot_instance else False
-    }, 200
 
+# Both responses are static apart from one flag, so encode them once
+_HEALTH_UP = json.dumps({'status': 'healthy', 'bot_running': True}).encode()
+_HEALTH_DOWN = json.dumps({'status': 'healthy', 'bot_running': False}).encode()
+_INDEX_BYTES = json.dumps({
+    'name': 'Bluesky Engagement Analytics Bot',
+    'status': 'running',
+    'version': '1.0.0'
+}).encode()
 
-@app.route('/')
-def index():
-    """Root endpoint."""
-    return {
-        'name': 'Bluesky Engagement Analytics Bot',
-        'status': 'running',
-        'version': '1.0.0'
-    }, 200
+
+def _build_flask_app():
+    """
+    Build the Flask app for health checks.
+
+    Flask is imported here rather than at module load so --test runs
+    don't pay for importing Werkzeug and friends.
+
+    Returns:
+        Flask application
+    """
+    from flask import Flask, Response
+
+    app = Flask(__name__)
+
+    @app.route('/health')
+    def health_check():
+        """Health check endpoint for Fly.io."""
+        running = bot_instance.running if bot_instance else False
+        return Response(_HEALTH_UP if running else _HEALTH_DOWN, status=200, mimetype='application/json')
+
+    @app.route('/')
+    def index():
+        """Root endpoint."""
+        return Response(_INDEX_BYTES, status=200, mimetype='application/json')
+
+    return app
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
-    logger.info(f"Received signal {signum}")
+    logger.info("Received signal %s", signum)
     if bot_instance:
         bot_instance.stop()
     sys.exit(0)
@@ -63,13 +82,13 @@ def run_bot():
     try:
         # Validate configuration
         logger.info("Loading configuration...")
-        Config.validate()
+        CONFIG.validate()
 
         # Initialize client
         logger.info("Initializing Bluesky client...")
         client = BlueskyClient(
-            handle=Config.BLUESKY_HANDLE,
-            app_password=Config.BLUESKY_APP_PASSWORD
+            handle=CONFIG.BLUESKY_HANDLE,
+            app_password=CONFIG.BLUESKY_APP_PASSWORD
         )
 
         # Login
@@ -78,25 +97,28 @@ def run_bot():
 
         # Initialize bot
         logger.info("Starting bot...")
-        bot_instance = BlueskyBot(client=client, config=Config)
+        bot_instance = BlueskyBot(client=client, config=CONFIG)
 
-        # Start polling
-        bot_instance.poll_mentions()
+        # Listen for mentions
+        if CONFIG.USE_JETSTREAM:
+            bot_instance.stream_mentions()
+        else:
+            bot_instance.poll_mentions()
 
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
 def run_test(handle: str):
     """Run analytics on a specific handle and print the results (no replies posted)."""
-    logger.info(f"TEST MODE: Analyzing @{handle}")
+    logger.info("TEST MODE: Analyzing @%s", handle)
 
     # Initialize client and login
-    Config.validate()
+    CONFIG.validate()
     client = BlueskyClient(
-        handle=Config.BLUESKY_HANDLE,
-        app_password=Config.BLUESKY_APP_PASSWORD
+        handle=CONFIG.BLUESKY_HANDLE,
+        app_password=CONFIG.BLUESKY_APP_PASSWORD
     )
     client.login()
 
@@ -106,8 +128,8 @@ def run_test(handle: str):
         return
 
     # Fetch posts
-    logger.info(f"Fetching posts for @{handle}...")
-    posts = client.fetch_all_posts(actor=handle, max_posts=Config.MAX_POSTS)
+    logger.info("Fetching posts for @%s...", handle)
+    posts = client.fetch_all_posts(actor=handle, max_posts=CONFIG.MAX_POSTS)
 
     if not posts:
         print(f"\nNo posts found for @{handle}")
@@ -116,8 +138,8 @@ def run_test(handle: str):
     print(f"\nFetched {len(posts)} posts for @{handle}\n")
 
     # Analyze
-    analytics = PostAnalytics(min_engagement_for_ratio=Config.MIN_ENGAGEMENT_FOR_RATIO)
-    analysis = analytics.analyze_user_posts(posts=posts, recent_days=Config.RECENT_DAYS)
+    analytics = PostAnalytics(min_engagement_for_ratio=CONFIG.MIN_ENGAGEMENT_FOR_RATIO)
+    analysis = analytics.analyze_user_posts(posts=posts, recent_days=CONFIG.RECENT_DAYS)
 
     # Format and print
     formatter = ResponseFormatter()
@@ -125,15 +147,17 @@ def run_test(handle: str):
         top_recent=analysis['top_recent'],
         top_all_time=analysis['top_all_time'],
         handle=handle,
-        recent_days=Config.RECENT_DAYS
+        recent_days=CONFIG.RECENT_DAYS
     )
 
-    print("=" * 60)
+    # Build the report and write it in one go
+    out = [_BANNER]
     for i, post_text in enumerate(thread_posts, start=1):
-        print(f"--- Post {i} ---")
-        print(post_text)
-        print()
-    print("=" * 60)
+        out.append(f"--- Post {i} ---")
+        out.append(post_text)
+        out.append("")
+    out.append(_BANNER)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -150,9 +174,9 @@ def main():
         run_test(args.test)
         return
 
-    logger.info("=" * 60)
+    logger.info(_BANNER)
     logger.info("Bluesky Engagement Analytics Bot")
-    logger.info("=" * 60)
+    logger.info(_BANNER)
 
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
@@ -162,13 +186,16 @@ def main():
     bot_thread = threading.Thread(target=run_bot, daemon=True)
     bot_thread.start()
 
-    # Run Flask server for health checks
-    logger.info(f"Starting health check server on port {Config.HEALTH_CHECK_PORT}...")
-    app.run(
+    # Serve health checks with a production WSGI server rather than
+    # Werkzeug's development server
+    from waitress import serve
+
+    logger.info("Starting health check server on port %s...", CONFIG.HEALTH_CHECK_PORT)
+    serve(
+        _build_flask_app(),
         host='0.0.0.0',
-        port=Config.HEALTH_CHECK_PORT,
-        debug=False,
-        use_reloader=False
+        port=CONFIG.HEALTH_CHECK_PORT,
+        threads=2
     )
 
 
@@ -0,0 +1,37 @@
+"""Token bucket rate limiting for outgoing API calls."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket that only blocks once the burst allowance is used up."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Tokens refilled per second
+            burst: Maximum number of tokens that can be spent back-to-back
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping only if none are available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                time.sleep(wait)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+
+            self._tokens -= 1
@@ -1,10 +1,18 @@
 """Shared test fixtures for hype_bot tests."""
 
 import pytest
+from collections import namedtuple
 from datetime import datetime, timezone
+from functools import lru_cache
 from types import SimpleNamespace
 
 
+# Cheaper to build than nested SimpleNamespaces; posts are never mutated
+_PostRec = namedtuple('_PostRec', 'text created_at')
+_Post = namedtuple('_Post', 'like_count repost_count reply_count record uri indexed_at')
+
+
+@lru_cache(maxsize=128)
 def make_post(
     likes=0,
     reposts=0,
@@ -14,18 +22,19 @@ def make_post(
     indexed_at=None,
     created_at=None,
 ):
-    """Factory for creating mock post objects."""
-    record = SimpleNamespace(
-        text=text,
-        created_at=created_at or "2025-01-15T12:00:00.000Z",
-    )
-    return SimpleNamespace(
-        like_count=likes,
-        repost_count=reposts,
-        reply_count=replies,
-        record=record,
-        uri=uri,
-        indexed_at=indexed_at or "2025-01-15T12:00:00.000Z",
+    """
+    Factory for creating mock post objects.
+
+    Memoized on its arguments, so identical calls return the same shared,
+    read-only post; use ._replace() to derive a variant.
+    """
+    return _Post(
+        likes,
+        reposts,
+        replies,
+        _PostRec(text, created_at or "2025-01-15T12:00:00.000Z"),
+        uri,
+        indexed_at or "2025-01-15T12:00:00.000Z",
     )
 
 
@@ -57,9 +66,9 @@ def sample_posts():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def formatter():
-    """ResponseFormatter instance."""
+    """ResponseFormatter instance, shared; it has no instance state to leak."""
     from src.formatter import ResponseFormatter
     return ResponseFormatter()
 
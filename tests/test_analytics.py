@@ -3,6 +3,7 @@
 import pytest
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
+from unittest.mock import patch
 from src.analytics import PostAnalytics
 from tests.conftest import make_post
 
@@ -56,11 +57,56 @@ class TestGetPostDate:
         assert result is not None
         assert result.month == 3
 
+    def test_empty_indexed_at_uses_created_at(self):
+        post = SimpleNamespace(
+            indexed_at=None,
+            record=SimpleNamespace(created_at="2025-03-01T08:00:00.000Z"),
+        )
+        result = PostAnalytics.get_post_date(post)
+        assert result is not None
+        assert result.month == 3
+
     def test_no_date(self):
         post = SimpleNamespace()
         result = PostAnalytics.get_post_date(post)
         assert result is None
 
+    def test_utc_suffix_is_timezone_aware(self):
+        post = make_post(indexed_at="2025-06-15T12:00:00.000Z")
+        result = PostAnalytics.get_post_date(post)
+        assert result.utcoffset() == timedelta(0)
+
+    def test_non_iso_fallback(self):
+        post = make_post(indexed_at="June 15 2025 12:00")
+        result = PostAnalytics.get_post_date(post)
+        assert result is not None
+        assert result.day == 15
+
+
+class TestFindTopKPosts:
+    def test_returns_k_highest_in_order(self):
+        posts = [
+            make_post(likes=10),
+            make_post(likes=50),
+            make_post(likes=30),
+            make_post(likes=5),
+        ]
+        result = PostAnalytics.find_top_k_posts(
+            posts, 2, PostAnalytics.calculate_engagement
+        )
+        assert [score for _, score in result] == [50, 30]
+        assert result[0][0] is posts[1]
+
+    def test_k_larger_than_posts(self):
+        posts = [make_post(likes=1)]
+        result = PostAnalytics.find_top_k_posts(
+            posts, 3, PostAnalytics.calculate_engagement
+        )
+        assert len(result) == 1
+
+    def test_empty_list(self):
+        assert PostAnalytics.find_top_k_posts([], 3, PostAnalytics.calculate_engagement) == []
+
 
 class TestFindTopRecentPost:
     def test_finds_top_within_window(self, analytics):
@@ -84,6 +130,17 @@ class TestFindTopRecentPost:
         result = analytics.find_top_recent_post([], days=30)
         assert result is None
 
+    def test_mixed_naive_and_aware_dates(self, analytics):
+        naive_now = datetime.now().isoformat()
+        aware_old = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
+        posts = [
+            make_post(likes=100, indexed_at=aware_old),
+            make_post(likes=10, indexed_at=naive_now),
+        ]
+        post, engagement = analytics.find_top_recent_post(posts, days=30)
+        assert post is posts[1]
+        assert engagement == 10
+
 
 class TestFindTopAllTimePost:
     def test_finds_highest_engagement(self, analytics):
@@ -108,6 +165,12 @@ class TestFindTopAllTimePost:
         _, engagement = result
         assert engagement == 7
 
+    def test_tie_keeps_first_post(self, analytics):
+        first = make_post(likes=10, text="first")
+        second = make_post(likes=10, text="second")
+        post, _ = analytics.find_top_all_time_post([first, second])
+        assert post is first
+
 
 class TestFindMostRatioedPost:
     def test_finds_highest_ratio(self, analytics):
@@ -156,3 +219,30 @@ class TestAnalyzeUserPosts:
         assert result['top_recent'] is None
         assert result['top_all_time'] is None
         assert result['most_ratioed'] is None
+
+    def test_reads_each_post_date_at_most_once(self, analytics):
+        now = datetime.now(timezone.utc).isoformat()
+        posts = [make_post(likes=i, indexed_at=now) for i in range(20)]
+        with patch.object(
+            PostAnalytics, "get_post_date", wraps=PostAnalytics.get_post_date
+        ) as mock_get_date:
+            analytics.analyze_user_posts(posts)
+        assert mock_get_date.call_count <= len(posts)
+
+    def test_matches_per_category_scans(self):
+        analytics = PostAnalytics(min_engagement_for_ratio=5)
+        now = datetime.now(timezone.utc).isoformat()
+        old_date = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
+        posts = [
+            make_post(likes=500, reposts=100, replies=10, indexed_at=old_date),
+            make_post(likes=50, reposts=20, replies=10, indexed_at=now),
+            make_post(likes=6, replies=60, indexed_at=now),
+            make_post(likes=2, replies=30, indexed_at=now),
+        ]
+        result = analytics.analyze_user_posts(posts, recent_days=30)
+        assert result['top_recent'] == analytics.find_top_recent_post(posts, 30)
+        assert result['top_all_time'] == analytics.find_top_all_time_post(posts)
+        assert result['most_ratioed'] == analytics.find_most_ratioed_post(posts)
+        assert result['top_recent'][0] is posts[1]
+        assert result['top_all_time'][0] is posts[0]
+        assert result['most_ratioed'][0] is posts[2]
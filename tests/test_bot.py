@@ -39,9 +39,21 @@ class TestMentionTracker:
 
     def test_handles_missing_file(self, tmp_path):
         tracker = MentionTracker(data_dir=str(tmp_path))
-        assert tracker.processed_uris == set()
+        assert len(tracker.processed_uris) == 0
         assert tracker.last_seen_at is None
 
+    def test_evicts_oldest_beyond_capacity(self, tmp_path):
+        tracker = MentionTracker(data_dir=str(tmp_path), max_processed=2)
+        tracker.mark_processed("at://uri1")
+        tracker.mark_processed("at://uri2")
+        tracker.mark_processed("at://uri3")
+        assert tracker.is_processed("at://uri1") is False
+        assert tracker.is_processed("at://uri2") is True
+        assert tracker.is_processed("at://uri3") is True
+
+        tracker2 = MentionTracker(data_dir=str(tmp_path), max_processed=2)
+        assert list(tracker2.processed_uris) == ["at://uri2", "at://uri3"]
+
 
 class TestBlueskyBotProcessMention:
     def _make_bot(self, tmp_path):
@@ -114,3 +126,56 @@ class TestBlueskyBotProcessMention:
 
         result = bot.process_mention(mention)
         assert result is False
+
+
+class TestBlueskyBotStreamMentions:
+    def test_catches_up_by_polling_after_disconnect(self, tmp_path):
+        client = MagicMock()
+        config = SimpleNamespace(
+            MAX_POSTS=10000,
+            RECENT_DAYS=30,
+            MIN_ENGAGEMENT_FOR_RATIO=5,
+            POLL_INTERVAL=30,
+        )
+        bot = BlueskyBot(client=client, config=config)
+        bot.tracker = MentionTracker(data_dir=str(tmp_path))
+        client.get_mentions.return_value = []
+
+        def connect_jetstream(on_mention, running):
+            if client.connect_jetstream.call_count == 1:
+                raise ConnectionError("dropped")
+            bot.stop()
+
+        client.connect_jetstream.side_effect = connect_jetstream
+        with patch("src.bot.time.sleep"):
+            bot.stream_mentions()
+
+        assert client.connect_jetstream.call_count == 2
+        assert client.get_mentions.call_count == 2
+
+    def test_streamed_mention_does_not_move_seen_marker(self, tmp_path):
+        client = MagicMock()
+        config = SimpleNamespace(
+            MAX_POSTS=10000,
+            RECENT_DAYS=30,
+            MIN_ENGAGEMENT_FOR_RATIO=5,
+            POLL_INTERVAL=30,
+        )
+        bot = BlueskyBot(client=client, config=config)
+        bot.tracker = MentionTracker(data_dir=str(tmp_path))
+        bot.process_mention = MagicMock(return_value=True)
+        client.get_mentions.return_value = []
+
+        # createdAt comes from the posting client and can be in the future
+        mention = make_mention(indexed_at="2099-01-01T00:00:00.000Z")
+
+        def connect_jetstream(on_mention, running):
+            on_mention(mention)
+            bot.stop()
+
+        client.connect_jetstream.side_effect = connect_jetstream
+        bot.stream_mentions()
+
+        bot.process_mention.assert_called_once_with(mention)
+        assert bot.tracker.last_seen_at is None
+        client.update_seen_notifications.assert_not_called()
@@ -0,0 +1,35 @@
+"""Tests for the TTLCache."""
+
+from unittest.mock import patch
+from src.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_missing_returns_default(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        assert cache.get("a") is None
+        assert cache.get("a", 1) == 1
+
+    def test_set_and_get(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", {"title": "A"})
+        assert cache.get("a") == {"title": "A"}
+        assert "a" in cache
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        with patch("src.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.cache.time.monotonic", return_value=161.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
@@ -1,21 +1,61 @@
 """Tests for the BlueskyClient wrapper."""
 
+import json
+import threading
+import httpx
 import pytest
-from unittest.mock import MagicMock, patch
+from collections import namedtuple
+from unittest.mock import Mock, patch
 from types import SimpleNamespace
-from src.client import BlueskyClient
+from atproto import models
+from src.client import BlueskyClient, _OG_CACHE, _parse_og, _read_head
+from tests.conftest import make_post
 
 
-@pytest.fixture
-def client():
-    """Create a BlueskyClient with a mocked atproto client."""
-    with patch("src.client.AtProtoClient") as MockClient:
-        mock_atproto = MagicMock()
-        MockClient.return_value = mock_atproto
-        bsky_client = BlueskyClient(
-            handle="bot.bsky.social", app_password="test-password"
+class _FakeAtProto:
+    """Stand-in for the atproto Client with plain Mocks at just the endpoints used."""
+
+    def __init__(self):
+        self.login = Mock()
+        self.send_post = Mock()
+        self.upload_blob = Mock()
+        self.me = SimpleNamespace(did="did:plc:bot")
+        self.app = SimpleNamespace(bsky=SimpleNamespace(
+            notification=SimpleNamespace(list_notifications=Mock(), update_seen=Mock()),
+            feed=SimpleNamespace(get_author_feed=Mock()),
+            actor=SimpleNamespace(get_profile=Mock()),
+            graph=SimpleNamespace(get_relationships=Mock()),
+        ))
+        bsky = self.app.bsky
+        self._leaves = (
+            self.login, self.send_post, self.upload_blob,
+            bsky.notification.list_notifications, bsky.notification.update_seen,
+            bsky.feed.get_author_feed, bsky.actor.get_profile, bsky.graph.get_relationships,
         )
-        yield bsky_client, mock_atproto
+
+    def reset_mock(self, **kwargs):
+        for leaf in self._leaves:
+            leaf.reset_mock(**kwargs)
+
+
+@pytest.fixture(scope="module")
+def shared_atproto():
+    """One stubbed atproto client per module; its Mocks are reset per test."""
+    return _FakeAtProto()
+
+
+@pytest.fixture
+def client(shared_atproto, monkeypatch):
+    """Create a fresh BlueskyClient around the shared atproto stub."""
+    shared_atproto.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("src.client.AtProtoClient", lambda *args, **kwargs: shared_atproto)
+    # The stub never uses it, so skip building a real HTTP/2 request pool
+    monkeypatch.setattr("src.client.AtProtoRequest", lambda *args, **kwargs: None)
+    _OG_CACHE.clear()
+    bsky_client = BlueskyClient(
+        handle="bot.bsky.social", app_password="test-password"
+    )
+    return bsky_client, shared_atproto
 
 
 class TestLogin:
@@ -33,27 +73,177 @@ class TestLogin:
             bsky_client.login()
 
 
+def _jetstream_frame(mentioned_did, operation="create", rkey="3abc"):
+    return json.dumps({
+        "did": "did:plc:author",
+        "kind": "commit",
+        "commit": {
+            "operation": operation,
+            "collection": "app.bsky.feed.post",
+            "rkey": rkey,
+            "cid": "bafycid",
+            "record": {
+                "text": "hey @bot",
+                "createdAt": "2025-01-15T12:00:00.000Z",
+                "facets": [{
+                    "index": {"byteStart": 4, "byteEnd": 8},
+                    "features": [{
+                        "$type": "app.bsky.richtext.facet#mention",
+                        "did": mentioned_did,
+                    }],
+                }],
+            },
+        },
+    })
+
+
+class TestParseJetstreamMention:
+    BOT_DID = "did:plc:bot"
+
+    def _frame(self, mentioned_did, operation="create"):
+        return _jetstream_frame(mentioned_did, operation)
+
+    def test_builds_mention(self):
+        mention = BlueskyClient._parse_jetstream_mention(
+            self._frame(self.BOT_DID), self.BOT_DID
+        )
+        assert mention.uri == "at://did:plc:author/app.bsky.feed.post/3abc"
+        assert mention.cid == "bafycid"
+        assert mention.author.did == "did:plc:author"
+        assert mention.indexed_at == "2025-01-15T12:00:00.000Z"
+
+    def test_ignores_other_mentions(self):
+        frame = self._frame("did:plc:someone")
+        assert BlueskyClient._parse_jetstream_mention(frame, self.BOT_DID) is None
+
+    def test_ignores_non_create(self):
+        frame = self._frame(self.BOT_DID, operation="delete")
+        assert BlueskyClient._parse_jetstream_mention(frame, self.BOT_DID) is None
+
+
+class _FakeWebSocket:
+    """Serves canned frames from recv(), then drops the connection."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.drained = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def recv(self, timeout=None, decode=None):
+        if self.frames:
+            frame = self.frames.pop(0)
+            return frame.decode() if decode and isinstance(frame, bytes) else frame
+        self.drained.set()
+        raise ConnectionError("dropped")
+
+
+class TestConnectJetstream:
+    def test_keeps_reading_while_handling_mentions(self, client, monkeypatch):
+        bsky_client, _ = client
+        ws = _FakeWebSocket([
+            _jetstream_frame("did:plc:bot", rkey="1").encode(),
+            _jetstream_frame("did:plc:someone", rkey="2"),
+            _jetstream_frame("did:plc:bot", rkey="3"),
+        ])
+        monkeypatch.setattr("src.client.ws_connect", lambda url: ws)
+
+        handled = []
+
+        def on_mention(mention):
+            # Only returns promptly if the socket was read to the end meanwhile
+            handled.append((mention.uri, ws.drained.wait(timeout=2)))
+
+        with pytest.raises(ConnectionError):
+            bsky_client.connect_jetstream(on_mention)
+
+        assert handled == [
+            ("at://did:plc:author/app.bsky.feed.post/1", True),
+            ("at://did:plc:author/app.bsky.feed.post/3", True),
+        ]
+
+
+_FeedItem = namedtuple('_FeedItem', 'post reason')
+
+
+def _feed_item(text, reason=None):
+    return _FeedItem(make_post(text=text), reason)
+
+
+# Canned responses built once; tuples so no test can mutate them
+_MENTIONS_RESPONSE = SimpleNamespace(notifications=(
+    SimpleNamespace(reason="mention", uri="at://1"),
+    SimpleNamespace(reason="mention", uri="at://3"),
+))
+_MIXED_REASONS_RESPONSE = SimpleNamespace(notifications=(
+    SimpleNamespace(reason="mention", uri="at://1"),
+    SimpleNamespace(reason="like", uri="at://2"),
+))
+_EMPTY_NOTIFICATIONS = SimpleNamespace(notifications=())
+_NOTIFICATION_PAGES = (
+    SimpleNamespace(
+        notifications=(
+            SimpleNamespace(reason="mention", uri="at://5", indexed_at="2025-01-05"),
+            SimpleNamespace(reason="mention", uri="at://4", indexed_at="2025-01-04"),
+        ),
+        cursor="page2",
+    ),
+    SimpleNamespace(
+        notifications=(
+            SimpleNamespace(reason="mention", uri="at://3", indexed_at="2025-01-03"),
+            SimpleNamespace(reason="mention", uri="at://2", indexed_at="2025-01-02"),
+        ),
+        cursor="page3",
+    ),
+)
+
+_SINGLE_POST_FEED = SimpleNamespace(feed=(_feed_item("post1"),), cursor=None)
+_FEED_WITH_REPOST = SimpleNamespace(
+    feed=(_feed_item("original"), _feed_item("repost", SimpleNamespace(type="repost"))),
+    cursor=None,
+)
+_FEED_PAGES = (
+    SimpleNamespace(feed=(_feed_item("p1"),), cursor="next_page"),
+    SimpleNamespace(feed=(_feed_item("p2"),), cursor=None),
+)
+
+
 class TestGetMentions:
     def test_filters_mentions(self, client):
         bsky_client, mock_atproto = client
-        mock_atproto.app.bsky.notification.list_notifications.return_value = (
-            SimpleNamespace(
-                notifications=[
-                    SimpleNamespace(reason="mention", uri="at://1"),
-                    SimpleNamespace(reason="like", uri="at://2"),
-                    SimpleNamespace(reason="mention", uri="at://3"),
-                    SimpleNamespace(reason="follow", uri="at://4"),
-                ]
-            )
-        )
+        mock_atproto.app.bsky.notification.list_notifications.return_value = _MENTIONS_RESPONSE
         mentions = bsky_client.get_mentions()
         assert len(mentions) == 2
         assert all(m.reason == "mention" for m in mentions)
+        mock_atproto.app.bsky.notification.list_notifications.assert_called_once_with(
+            params={"limit": 50, "reasons": ["mention"]}
+        )
+
+    def test_drops_other_reasons_if_server_ignores_filter(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.app.bsky.notification.list_notifications.return_value = (
+            _MIXED_REASONS_RESPONSE
+        )
+        mentions = bsky_client.get_mentions()
+        assert [m.uri for m in mentions] == ["at://1"]
+
+    def test_paginates_until_seen_notification(self, client):
+        bsky_client, mock_atproto = client
+        list_notifications = mock_atproto.app.bsky.notification.list_notifications
+        list_notifications.side_effect = _NOTIFICATION_PAGES
+        mentions = bsky_client.get_mentions(seen_at="2025-01-02")
+        assert [m.uri for m in mentions] == ["at://5", "at://4", "at://3"]
+        assert list_notifications.call_count == 2
+        assert list_notifications.call_args[1]["params"]["cursor"] == "page2"
 
     def test_no_notifications(self, client):
         bsky_client, mock_atproto = client
         mock_atproto.app.bsky.notification.list_notifications.return_value = (
-            SimpleNamespace(notifications=[])
+            _EMPTY_NOTIFICATIONS
         )
         mentions = bsky_client.get_mentions()
         assert mentions == []
@@ -62,90 +252,126 @@ class TestGetMentions:
 class TestFetchAllPosts:
     def test_single_page(self, client):
         bsky_client, mock_atproto = client
-        mock_atproto.app.bsky.feed.get_author_feed.return_value = SimpleNamespace(
-            feed=[
-                SimpleNamespace(
-                    post=SimpleNamespace(record=SimpleNamespace(text="post1")),
-                    reason=None,
-                ),
-            ],
-            cursor=None,
-        )
+        mock_atproto.app.bsky.feed.get_author_feed.return_value = _SINGLE_POST_FEED
         posts = bsky_client.fetch_all_posts("did:plc:user1", max_posts=10000)
         assert len(posts) == 1
 
     def test_filters_reposts(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.app.bsky.feed.get_author_feed.return_value = _FEED_WITH_REPOST
+        posts = bsky_client.fetch_all_posts("did:plc:user1")
+        assert len(posts) == 1
+        assert posts[0].record.text == "original"
+
+    def test_copies_post_fields(self, client):
         bsky_client, mock_atproto = client
         mock_atproto.app.bsky.feed.get_author_feed.return_value = SimpleNamespace(
             feed=[
-                SimpleNamespace(
-                    post=SimpleNamespace(record=SimpleNamespace(text="original")),
-                    reason=None,
-                ),
-                SimpleNamespace(
-                    post=SimpleNamespace(record=SimpleNamespace(text="repost")),
-                    reason=SimpleNamespace(type="repost"),
+                _FeedItem(
+                    make_post(
+                        likes=10,
+                        replies=3,
+                        uri="at://did:plc:user1/app.bsky.feed.post/abc",
+                    )._replace(
+                        repost_count=None,
+                        record={"text": "hello", "created_at": "2025-01-15T11:59:00.000Z"},
+                    ),
+                    None,
                 ),
             ],
             cursor=None,
         )
-        posts = bsky_client.fetch_all_posts("did:plc:user1")
-        assert len(posts) == 1
-        assert posts[0].record.text == "original"
+        post = bsky_client.fetch_all_posts("did:plc:user1")[0]
+        assert (post.like_count, post.repost_count, post.reply_count) == (10, 0, 3)
+        assert post.uri == "at://did:plc:user1/app.bsky.feed.post/abc"
+        assert post.indexed_at == "2025-01-15T12:00:00.000Z"
+        assert post.record.text == "hello"
+        assert post.record.created_at == "2025-01-15T11:59:00.000Z"
 
     def test_pagination(self, client):
         bsky_client, mock_atproto = client
         # First page returns cursor, second page returns None
-        mock_atproto.app.bsky.feed.get_author_feed.side_effect = [
-            SimpleNamespace(
-                feed=[
-                    SimpleNamespace(
-                        post=SimpleNamespace(record=SimpleNamespace(text="p1")),
-                        reason=None,
-                    ),
-                ],
-                cursor="next_page",
-            ),
-            SimpleNamespace(
-                feed=[
-                    SimpleNamespace(
-                        post=SimpleNamespace(record=SimpleNamespace(text="p2")),
-                        reason=None,
-                    ),
-                ],
-                cursor=None,
-            ),
-        ]
+        mock_atproto.app.bsky.feed.get_author_feed.side_effect = _FEED_PAGES
         posts = bsky_client.fetch_all_posts("did:plc:user1")
         assert len(posts) == 2
 
+    def test_no_prefetch_once_max_posts_reached(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.app.bsky.feed.get_author_feed.return_value = _FEED_PAGES[0]
+        posts = bsky_client.fetch_all_posts("did:plc:user1", max_posts=1)
+        assert len(posts) == 1
+        assert mock_atproto.app.bsky.feed.get_author_feed.call_count == 1
 
-class TestIsFollowingBot:
-    def test_user_follows_bot(self, client):
+    def test_fetches_more_when_reposts_fall_short_of_max(self, client):
         bsky_client, mock_atproto = client
-        mock_atproto.app.bsky.actor.get_profile.return_value = SimpleNamespace(
-            viewer=SimpleNamespace(followed_by="at://did:plc:user/follow/123")
+        repost = SimpleNamespace(type="repost")
+        page = tuple(
+            _feed_item("post", repost if i % 2 else None) for i in range(100)
         )
-        assert bsky_client.is_following_bot("did:plc:user1") is True
+        mock_atproto.app.bsky.feed.get_author_feed.side_effect = [
+            SimpleNamespace(feed=page, cursor="p2"),
+            SimpleNamespace(feed=page, cursor="p3"),
+            SimpleNamespace(feed=page, cursor="p4"),
+        ]
+        posts = bsky_client.fetch_all_posts("did:plc:user1", max_posts=150)
+        assert len(posts) == 150
+        assert mock_atproto.app.bsky.feed.get_author_feed.call_count == 3
 
-    def test_user_does_not_follow(self, client):
+
+def _relationships(*followed_by):
+    return SimpleNamespace(relationships=[
+        SimpleNamespace(followed_by=f) for f in followed_by
+    ])
+
+
+class TestIsFollowingBot:
+    @pytest.mark.parametrize(
+        "response, side_effect, expected",
+        [
+            (_relationships("at://did:plc:user/follow/123"), None, True),
+            (_relationships(None), None, False),
+            (
+                SimpleNamespace(relationships=[
+                    SimpleNamespace(actor="did:plc:user1", not_found=True)
+                ]),
+                None,
+                False,
+            ),
+            (None, Exception("API error"), False),
+        ],
+        ids=["follows", "not_follows", "not_found", "api_error"],
+    )
+    def test_follow_status(self, client, response, side_effect, expected):
         bsky_client, mock_atproto = client
-        mock_atproto.app.bsky.actor.get_profile.return_value = SimpleNamespace(
-            viewer=SimpleNamespace(followed_by=None)
-        )
-        assert bsky_client.is_following_bot("did:plc:user1") is False
+        get_relationships = mock_atproto.app.bsky.graph.get_relationships
+        get_relationships.return_value = response
+        get_relationships.side_effect = side_effect
+        assert bsky_client.is_following_bot("did:plc:user1") is expected
 
-    def test_no_viewer(self, client):
+    def test_caches_followers_only(self, client):
         bsky_client, mock_atproto = client
-        mock_atproto.app.bsky.actor.get_profile.return_value = SimpleNamespace(
-            viewer=None
-        )
-        assert bsky_client.is_following_bot("did:plc:user1") is False
+        get_relationships = mock_atproto.app.bsky.graph.get_relationships
+        get_relationships.return_value = _relationships("at://follow/1", None)
+        bsky_client.are_following_bot(["did:plc:a", "did:plc:b"])
+
+        get_relationships.reset_mock()
+        get_relationships.return_value = _relationships("at://follow/2")
+        assert bsky_client.are_following_bot(["did:plc:a", "did:plc:b"]) == {
+            "did:plc:a": True,
+            "did:plc:b": True,
+        }
+        assert get_relationships.call_args[0][0]["others"] == ["did:plc:b"]
 
-    def test_api_error(self, client):
+    def test_batches_requests(self, client):
         bsky_client, mock_atproto = client
-        mock_atproto.app.bsky.actor.get_profile.side_effect = Exception("API error")
-        assert bsky_client.is_following_bot("did:plc:user1") is False
+        get_relationships = mock_atproto.app.bsky.graph.get_relationships
+        get_relationships.side_effect = lambda params: _relationships(
+            *[None] * len(params["others"])
+        )
+        dids = [f"did:plc:{i}" for i in range(45)]
+        result = bsky_client.are_following_bot(dids)
+        assert len(result) == 45
+        assert [len(c[0][0]["others"]) for c in get_relationships.call_args_list] == [30, 15]
 
 
 class TestSendReply:
@@ -161,6 +387,26 @@ class TestSendReply:
         )
         assert uri == "at://reply/uri"
         assert cid == "replycid"
+        reply = mock_atproto.send_post.call_args[1]["reply_to"]
+        assert reply == {
+            "parent": {"uri": "at://parent/uri", "cid": "parentcid"},
+            "root": {"uri": "at://parent/uri", "cid": "parentcid"},
+        }
+
+    def test_reply_with_root(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.send_post.return_value = SimpleNamespace(
+            uri="at://reply/uri", cid="replycid"
+        )
+        bsky_client.send_reply(
+            text="Hello!",
+            parent_uri="at://parent/uri",
+            parent_cid="parentcid",
+            root_uri="at://root/uri",
+            root_cid="rootcid",
+        )
+        reply = mock_atproto.send_post.call_args[1]["reply_to"]
+        assert reply["root"] == {"uri": "at://root/uri", "cid": "rootcid"}
 
     def test_failed_reply(self, client):
         bsky_client, mock_atproto = client
@@ -172,3 +418,226 @@ class TestSendReply:
         )
         assert uri is None
         assert cid is None
+
+
+class TestDetectFacets:
+    def test_no_urls(self):
+        assert BlueskyClient._detect_facets("no links here") is None
+
+    def test_strips_trailing_punctuation(self):
+        facets = BlueskyClient._detect_facets("see https://example.com/a).")
+        assert len(facets) == 1
+        assert facets[0].features[0].uri == "https://example.com/a"
+        assert facets[0].index.byte_start == 4
+        assert facets[0].index.byte_end == 25
+
+    def test_scan_returns_first_url(self):
+        url, facets = BlueskyClient._scan_urls("a https://a.com, b https://b.com")
+        assert url == "https://a.com"
+        assert len(facets) == 2
+
+    def test_ascii_offsets(self):
+        _, facets = BlueskyClient._scan_urls("a https://a.com, b https://b.com")
+        assert [(f.index.byte_start, f.index.byte_end) for f in facets] == [
+            (2, 15),
+            (19, 32),
+        ]
+
+    def test_multibyte_offsets(self):
+        text = "🔥 https://a.com and ✨ https://b.com"
+        facets = BlueskyClient._detect_facets(text)
+        encoded = text.encode("utf-8")
+        uris = [
+            encoded[f.index.byte_start:f.index.byte_end].decode("utf-8")
+            for f in facets
+        ]
+        assert uris == ["https://a.com", "https://b.com"]
+
+
+class TestUpdateSeenNotifications:
+    def test_updates_seen(self, client):
+        bsky_client, mock_atproto = client
+        assert bsky_client.update_seen_notifications("2025-01-15T12:00:00.000Z") is True
+        mock_atproto.app.bsky.notification.update_seen.assert_called_once()
+
+    def test_skips_unchanged_timestamp(self, client):
+        bsky_client, mock_atproto = client
+        bsky_client.update_seen_notifications("2025-01-15T12:00:00.000Z")
+        assert bsky_client.update_seen_notifications("2025-01-15T12:00:00.000Z") is True
+        mock_atproto.app.bsky.notification.update_seen.assert_called_once()
+
+
+_BLOB = models.blob_ref.BlobRef(
+    mime_type="image/png",
+    size=3,
+    ref={"$link": "bafkreibme22gw2h7y2h7tg2fhqotaqjucnbc24deqo72b6mkl2egezxhvy"},
+)
+
+
+def _mock_http(routes):
+    """Build an httpx client that serves canned responses by URL."""
+    def handler(request):
+        status, headers, body = routes[str(request.url)]
+        return httpx.Response(status, headers=headers, content=body)
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class TestCreateExternalEmbed:
+    PAGE = (
+        b'<html><head>'
+        b'<meta property="og:title" content="Example">'
+        b'<meta property="og:description" content="An example page">'
+        b'<meta property="og:image" content="https://example.com/img.png">'
+        b'</head><body></body></html>'
+    )
+
+    def test_builds_card_with_thumbnail(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.upload_blob.return_value = SimpleNamespace(blob=_BLOB)
+        http = _mock_http({
+            "https://example.com/": (200, {"Content-Type": "text/html"}, self.PAGE),
+            "https://example.com/img.png": (200, {"Content-Type": "image/png"}, b"PNG"),
+        })
+        with patch("src.client._HTTP", http):
+            embed = bsky_client._create_external_embed("https://example.com/")
+        assert embed.external.title == "Example"
+        assert embed.external.description == "An example page"
+        mock_atproto.upload_blob.assert_called_once_with(b"PNG")
+
+    def test_http_error_returns_none(self, client):
+        bsky_client, _ = client
+        http = _mock_http({"https://example.com/": (404, {}, b"")})
+        with patch("src.client._HTTP", http):
+            assert bsky_client._create_external_embed("https://example.com/") is None
+
+    def test_repeat_url_is_served_from_cache(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.upload_blob.return_value = SimpleNamespace(blob=_BLOB)
+        requests = []
+
+        def handler(request):
+            requests.append(str(request.url))
+            if request.url.path == "/img.png":
+                return httpx.Response(
+                    200, headers={"Content-Type": "image/png"}, content=b"PNG"
+                )
+            return httpx.Response(200, content=self.PAGE)
+
+        http = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("src.client._HTTP", http):
+            bsky_client._create_external_embed("https://example.com/")
+            embed = bsky_client._create_external_embed(
+                "https://EXAMPLE.com/?utm_source=feed"
+            )
+        assert embed.external.title == "Example"
+        assert requests == ["https://example.com/", "https://example.com/img.png"]
+        mock_atproto.upload_blob.assert_called_once()
+
+
+class TestPrefetchLinkCards:
+    def test_builds_each_card_once(self, client):
+        bsky_client, _ = client
+        texts = ["a https://a.com", "b https://b.com", "again https://a.com", "none"]
+        with patch.object(bsky_client, "_create_external_embed") as create:
+            bsky_client.prefetch_link_cards(texts)
+        assert sorted(c[0][0] for c in create.call_args_list) == [
+            "https://a.com",
+            "https://b.com",
+        ]
+
+    def test_single_card_is_left_to_send(self, client):
+        bsky_client, _ = client
+        with patch.object(bsky_client, "_create_external_embed") as create:
+            bsky_client.prefetch_link_cards(["a https://a.com", "none"])
+        create.assert_not_called()
+
+
+class TestUploadThumbnail:
+    URL = "https://example.com/img"
+
+    def _upload(self, bsky_client, headers, status=200, body=b"IMG"):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(status, headers=headers, content=body)
+
+        with patch("src.client._HTTP", httpx.Client(transport=httpx.MockTransport(handler))):
+            thumb = bsky_client._upload_thumbnail(self.URL)
+        return thumb, seen[0]
+
+    def test_requests_bounded_range(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.upload_blob.return_value = SimpleNamespace(blob=_BLOB)
+        thumb, request = self._upload(bsky_client, {"Content-Type": "image/png"})
+        assert thumb is _BLOB
+        assert request.headers["Range"] == "bytes=0-999999"
+
+    def test_skips_non_image(self, client):
+        bsky_client, mock_atproto = client
+        thumb, _ = self._upload(bsky_client, {"Content-Type": "text/html"})
+        assert thumb is None
+        mock_atproto.upload_blob.assert_not_called()
+
+    def test_skips_oversized_png(self, client):
+        bsky_client, mock_atproto = client
+        headers = {"Content-Type": "image/png", "Content-Range": "bytes 0-999999/5000000"}
+        thumb, _ = self._upload(bsky_client, headers, status=206)
+        assert thumb is None
+        mock_atproto.upload_blob.assert_not_called()
+
+    def test_keeps_truncated_jpeg(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.upload_blob.return_value = SimpleNamespace(blob=_BLOB)
+        headers = {"Content-Type": "image/jpeg", "Content-Range": "bytes 0-999999/5000000"}
+        thumb, _ = self._upload(bsky_client, headers, status=206)
+        assert thumb is _BLOB
+
+    def test_identical_bytes_upload_once(self, client):
+        bsky_client, mock_atproto = client
+        mock_atproto.upload_blob.return_value = SimpleNamespace(blob=_BLOB)
+        self._upload(bsky_client, {"Content-Type": "image/png"})
+        self.URL = "https://other.example.com/img"
+        thumb, _ = self._upload(bsky_client, {"Content-Type": "image/png"})
+        assert thumb is _BLOB
+        mock_atproto.upload_blob.assert_called_once()
+
+
+class TestParseOg:
+    def test_either_attribute_order(self):
+        head = (
+            b'<meta property="og:title" content="Title">'
+            b'<meta content="Desc" property="og:description">'
+        )
+        assert _parse_og(head) == {"title": "Title", "description": "Desc"}
+
+    def test_unescapes_and_keeps_other_quote(self):
+        head = b'<meta property="og:title" content="Don&#39;t &amp; won\'t">'
+        assert _parse_og(head) == {"title": "Don't & won't"}
+
+    def test_ignores_non_og_meta(self):
+        head = (
+            b'<meta name="description" content="Plain">'
+            b'<meta data-property="og:title" content="Nope">'
+            b'<meta property="twitter:title" content="Bird">'
+        )
+        assert _parse_og(head) == {}
+
+
+class TestReadHead:
+    def _stream(self, body):
+        http = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        )
+        return http.stream("GET", "https://example.com/")
+
+    def test_stops_at_end_of_head_split_across_chunks(self):
+        body = b"<html><head>" + b"x" * 4081 + b"</HEAD><body>" + b"y" * 50000
+        with self._stream(body) as resp:
+            html = _read_head(resp)
+        assert html.endswith(b"</HEAD>")
+        assert b"<body>" not in html
+
+    def test_caps_at_limit_without_head(self):
+        with self._stream(b"z" * 50000) as resp:
+            assert len(_read_head(resp, limit=10000)) == 10000
@@ -0,0 +1,26 @@
+"""Tests for the Config settings object."""
+
+import dataclasses
+import pytest
+from src.config import Config
+
+
+class TestConfig:
+    def test_is_frozen(self):
+        config = Config(BLUESKY_HANDLE="bot.bsky.social", BLUESKY_APP_PASSWORD="pw")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.POLL_INTERVAL = 5
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("BLUESKY_HANDLE", "bot.bsky.social")
+        monkeypatch.setenv("POLL_INTERVAL", "45")
+        config = Config.from_env()
+        assert config.BLUESKY_HANDLE == "bot.bsky.social"
+        assert config.POLL_INTERVAL == 45
+
+    def test_validate_rejects_short_poll_interval(self):
+        config = Config(
+            BLUESKY_HANDLE="bot.bsky.social", BLUESKY_APP_PASSWORD="pw", POLL_INTERVAL=5
+        )
+        with pytest.raises(ValueError, match="POLL_INTERVAL"):
+            config.validate()
@@ -1,10 +1,14 @@
 """Tests for the ResponseFormatter."""
 
 import pytest
-from src.formatter import ResponseFormatter
+from src.formatter import ResponseFormatter, _normalize_post, _uri_to_url
 from tests.conftest import make_post
 
 
+# Longer than any preview, so it always gets truncated
+_LONG_POST = make_post(likes=100, reposts=50, replies=20, text="A" * 200)
+
+
 class TestUriToUrl:
     def test_valid_uri_with_handle(self):
         uri = "at://did:plc:abc123/app.bsky.feed.post/xyz789"
@@ -21,6 +25,20 @@ class TestUriToUrl:
         result = ResponseFormatter.uri_to_url(uri)
         assert result == uri  # returns original on failure
 
+    def test_too_few_segments(self):
+        uri = "at://did:plc:abc123/app.bsky.feed.post"
+        assert ResponseFormatter.uri_to_url(uri) == uri
+
+    def test_missing_uri(self):
+        assert ResponseFormatter.uri_to_url(None) is None
+
+    def test_repeat_calls_are_cached(self):
+        uri = "at://did:plc:cached/app.bsky.feed.post/xyz789"
+        ResponseFormatter.uri_to_url(uri, "user.bsky.social")
+        hits = _uri_to_url.cache_info().hits
+        ResponseFormatter.uri_to_url(uri, "user.bsky.social")
+        assert _uri_to_url.cache_info().hits == hits + 1
+
 
 class TestFormatEngagementStats:
     def test_normal_values(self):
@@ -35,18 +53,25 @@ class TestFormatEngagementStats:
 
 
 class TestTruncateText:
-    def test_under_limit(self):
-        result = ResponseFormatter.truncate_text("short", 10)
-        assert result == "short"
-
-    def test_at_limit(self):
-        result = ResponseFormatter.truncate_text("12345", 5)
-        assert result == "12345"
-
-    def test_over_limit(self):
-        result = ResponseFormatter.truncate_text("this is a long string", 10)
-        assert len(result) == 10
-        assert result.endswith("...")
+    @pytest.mark.parametrize(
+        "text, limit, expected_len",
+        [
+            ("short", 10, 5),
+            ("1234", 5, 4),
+            ("12345", 5, 5),
+            ("123456", 5, 5),
+            ("this is a long string", 10, 10),
+            ("A" * 200, 50, 50),
+        ],
+        ids=["well_under", "limit_minus_1", "at_limit", "limit_plus_1", "over", "far_over"],
+    )
+    def test_boundaries(self, text, limit, expected_len):
+        result = ResponseFormatter.truncate_text(text, limit)
+        assert len(result) == expected_len
+        if len(text) <= limit:
+            assert result == text
+        else:
+            assert result == text[:limit - 3] + "..."
 
 
 class TestGetPostPreview:
@@ -63,9 +88,46 @@ class TestGetPostPreview:
         assert result == "[Post content unavailable]"
 
     def test_whitespace_cleanup(self, formatter):
-        post = make_post(text="hello   world\n\nnewlines")
+        post = make_post(text="hello   world\n\nnewlines\tand\r\ntabs")
         result = formatter.get_post_preview(post)
-        assert "hello world newlines" in result
+        assert "hello world newlines and tabs" in result
+
+
+class TestNormalizePost:
+    def test_flattens_post_object(self):
+        post = make_post(likes=3, reposts=2, replies=1, text="Hi")
+        assert _normalize_post(post) == {
+            "uri": post.uri,
+            "record_text": "Hi",
+            "like_count": 3,
+            "repost_count": 2,
+            "reply_count": 1,
+        }
+
+    def test_dict_record_and_missing_record(self):
+        from types import SimpleNamespace
+        assert _normalize_post(SimpleNamespace(record={"text": "Hi"}))["record_text"] == "Hi"
+        assert _normalize_post(SimpleNamespace(record={}))["record_text"] is None
+        assert _normalize_post(SimpleNamespace())["record_text"] is None
+
+    def test_dict_passes_through(self, formatter):
+        post = {"uri": "at://did:plc:a/app.bsky.feed.post/r", "record_text": "Hi", "like_count": 4}
+        assert _normalize_post(post) is post
+        assert formatter.get_post_stats(post) == (4, 0, 0)
+        assert formatter.get_post_preview(post) == '"Hi"'
+
+
+class TestFormatThreadPostUrl:
+    def test_warns_on_unparseable_uri(self, formatter, caplog):
+        post = make_post(uri="not-a-valid-uri")
+        result = formatter.format_thread_post(emoji="🔥", title="Test", post=post)
+        assert result.endswith("not-a-valid-uri")
+        assert "Could not convert URI" in caplog.text
+
+
+class TestResponseFormatter:
+    def test_has_no_instance_dict(self, formatter):
+        assert not hasattr(formatter, "__dict__")
 
 
 class TestFormatThreadPost:
@@ -76,6 +138,20 @@ class TestFormatThreadPost:
         )
         assert len(result) <= 300
 
+    def test_over_limit_keeps_closing_quote(self, formatter):
+        post = make_post(likes=10, reposts=5, replies=2, text="word " * 40)
+        result = formatter.format_thread_post(
+            emoji="🔥", title="T" * 150, post=post, handle="user.bsky.social"
+        )
+        assert len(result) <= 300
+        preview = result.split("\n\n")[-2]
+        assert preview.startswith('"') and preview.endswith('..."')
+
+    def test_stats_match_format_engagement_stats(self, formatter):
+        post = make_post(likes=10, reposts=5, replies=2)
+        result = formatter.format_thread_post(emoji="🔥", title="Test", post=post)
+        assert ResponseFormatter.format_engagement_stats(10, 5, 2) in result
+
     def test_contains_required_elements(self, formatter):
         post = make_post(likes=10, reposts=5, replies=2, text="My post")
         result = formatter.format_thread_post(
@@ -100,21 +176,40 @@ class TestCreateThreadResponses:
         assert "🔥" in thread[0]
         assert "👑" in thread[1]
 
-    def test_missing_recent_and_alltime(self, formatter):
+    @pytest.mark.parametrize(
+        "has_recent, has_all_time, expected",
+        [
+            (False, False, ("No posts found", "No all-time")),
+            (False, True, ("No posts found", "All-Time")),
+            (True, False, ("Recent", "No all-time")),
+        ],
+        ids=["both_missing", "recent_missing", "all_time_missing"],
+    )
+    def test_missing_categories(self, formatter, has_recent, has_all_time, expected):
+        top = (make_post(likes=100), 100)
         thread = formatter.create_thread_responses(
-            top_recent=None,
-            top_all_time=None,
+            top_recent=top if has_recent else None,
+            top_all_time=top if has_all_time else None,
         )
-        assert len(thread) == 2
-        assert "No posts found" in thread[0]
-        assert "No all-time" in thread[1]
+        assert all(s in post_text for s, post_text in zip(expected, thread, strict=True))
 
     def test_all_posts_under_300_chars(self, formatter):
-        post = make_post(likes=100, reposts=50, replies=20, text="A" * 200)
         thread = formatter.create_thread_responses(
-            top_recent=(post, 170),
-            top_all_time=(post, 170),
+            top_recent=(_LONG_POST, 170),
+            top_all_time=(_LONG_POST, 170),
             handle="user.bsky.social",
         )
         for post_text in thread:
             assert len(post_text) <= 300
+
+    def test_benchmark(self, formatter, request):
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+
+        thread = benchmark(
+            formatter.create_thread_responses,
+            top_recent=(_LONG_POST, 170),
+            top_all_time=(_LONG_POST, 170),
+            handle="user.bsky.social",
+        )
+        assert len(thread) == 2
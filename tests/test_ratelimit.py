@@ -0,0 +1,22 @@
+"""Tests for the RateLimiter token bucket."""
+
+from unittest.mock import patch
+from src.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    def test_burst_does_not_sleep(self):
+        limiter = RateLimiter(rate=1.0, burst=3)
+        with patch("src.ratelimit.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.acquire()
+        mock_sleep.assert_not_called()
+
+    def test_sleeps_once_burst_exhausted(self):
+        limiter = RateLimiter(rate=2.0, burst=1)
+        with patch("src.ratelimit.time.monotonic", return_value=100.0), \
+                patch("src.ratelimit.time.sleep") as mock_sleep:
+            limiter._updated = 100.0
+            limiter.acquire()
+            limiter.acquire()
+        mock_sleep.assert_called_once_with(0.5)